@@ -12,52 +12,119 @@ Focus Areas:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import os
 import sys
 import json
+import threading
 import time
+import functools
 import jwt
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    json_loads = json.loads
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+@functools.lru_cache(maxsize=32)
+def _decode_unverified(token):
+    """Parse a JWT's claims once per token (signature is not checked)"""
+    return jwt.decode(token, options={"verify_signature": False})
+
 class AuthDebugTester:
     def __init__(self, base_url="https://viewtrends-1.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
         self.token = None
-        self.tests_run = 0
-        self.tests_passed = 0
-        self.test_results = []
+        self.test_results = []  # Pass/fail counts are derived from this at summary time
+        self._local = threading.local()  # Per-thread output/result buffers for concurrent tests
+        self._debug_auth_cache = None  # (status, parsed JSON or None, text) from /api/debug/auth
+        self._debug_auth_lock = threading.Lock()
+        
+        # One keep-alive session so the ~10 calls share pooled connections
+        # instead of each doing its own TCP+TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': 'AuthDebugTester/1.0'})
+
+    def _print(self, text=""):
+        """Print, or buffer when running inside a concurrent test"""
+        lines = getattr(self._local, 'lines', None)
+        if lines is None:
+            print(text)
+        else:
+            lines.append(text)
+
+    def _results(self):
+        """Result list for the current test: its own buffer when running concurrently"""
+        results = getattr(self._local, 'results', None)
+        return self.test_results if results is None else results
+
+    def _run_buffered(self, test):
+        """Run a test with its output and results captured so they can be merged in order"""
+        outer = (getattr(self._local, 'lines', None), getattr(self._local, 'results', None))
+        self._local.lines, self._local.results = lines, results = [], []
+        try:
+            test()
+        finally:
+            self._local.lines, self._local.results = outer
+        return lines, results
+
+    def run_concurrently(self, *tests):
+        """Run independent tests in parallel, reporting them in the given order"""
+        with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+            futures = [pool.submit(self._run_buffered, test) for test in tests]
+            for future in futures:
+                lines, results = future.result()
+                for line in lines:
+                    self._print(line)
+                self._results().extend(results)
 
     def log_test_result(self, test_name, success, details=""):
         """Log test result for summary"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-        
-        self.test_results.append({
+        self._results().append({
             "name": test_name,
             "success": success,
             "details": details
         })
         
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} - {test_name}")
+        self._print(f"{status} - {test_name}")
         if details:
-            print(f"    {details}")
+            self._print(f"    {details}")
+
+    def _get_debug_auth(self):
+        """Fetch /api/debug/auth once per run and share it between the tests that read it"""
+        with self._debug_auth_lock:
+            if self._debug_auth_cache is None:
+                response = self.session.get(f"{self.api_url}/debug/auth", timeout=30)
+                try:
+                    data = json_loads(response.content)
+                except json.JSONDecodeError:
+                    data = None
+                self._debug_auth_cache = (response.status_code, data, response.text)
+            return self._debug_auth_cache
 
     def test_debug_auth_endpoint(self):
         """Test the new /api/debug/auth endpoint (no authentication required)"""
-        print("\n🔍 TESTING DEBUG AUTH ENDPOINT")
-        print("-" * 50)
-        
-        url = f"{self.api_url}/debug/auth"
+        self._print("\n🔍 TESTING DEBUG AUTH ENDPOINT")
+        self._print("-" * 50)
         
         try:
-            response = requests.get(url, timeout=30)
+            status, data, text = self._get_debug_auth()
             
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    
+            if status == 200:
+                if data is not None:
                     # Verify expected fields are present
                     expected_fields = ['users', 'seeding_status', 'db_connected', 'total_users', 'timestamp']
                     missing_fields = [field for field in expected_fields if field not in data]
@@ -72,14 +139,15 @@ class AuthDebugTester:
                         # Check if users data is anonymized properly
                         users = data.get('users', [])
                         if users and isinstance(users, list):
-                            user_fields = users[0].keys() if users else []
-                            safe_fields = ['username', 'role']
-                            has_safe_fields = all(field in user_fields for field in safe_fields)
+                            user_fields = set(users[0])
+                            safe_fields = {'username', 'role'}
+                            # Every user entry must expose the safe fields, not just the first
+                            has_safe_fields = all(safe_fields.issubset(user) for user in users)
                             
                             self.log_test_result(
                                 "Debug Auth User Data Anonymization",
                                 has_safe_fields,
-                                f"User fields: {list(user_fields)}"
+                                f"User fields: {sorted(user_fields)}"
                             )
                         
                         # Check database connection status
@@ -98,7 +166,9 @@ class AuthDebugTester:
                             f"Seeding Status: {seeding_status}"
                         )
                         
-                        print(f"    Full Response: {json.dumps(data, indent=2)}")
+                        # The full payload is only useful when debugging; compact form keeps it one line
+                        if os.getenv('AUTH_TEST_VERBOSE'):
+                            self._print(f"    Full Response: {json_dumps(data).decode()}")
                         return True
                     else:
                         self.log_test_result(
@@ -108,7 +178,7 @@ class AuthDebugTester:
                         )
                         return False
                         
-                except json.JSONDecodeError:
+                else:
                     self.log_test_result(
                         "Debug Auth Endpoint JSON",
                         False,
@@ -119,7 +189,7 @@ class AuthDebugTester:
                 self.log_test_result(
                     "Debug Auth Endpoint Access",
                     False,
-                    f"HTTP {response.status_code}: {response.text}"
+                    f"HTTP {status}: {text}"
                 )
                 return False
                 
@@ -133,19 +203,19 @@ class AuthDebugTester:
 
     def test_admin_login_with_fallback(self):
         """Test admin login with emergency fallback system"""
-        print("\n🔐 TESTING ADMIN LOGIN WITH EMERGENCY FALLBACK")
-        print("-" * 50)
+        self._print("\n🔐 TESTING ADMIN LOGIN WITH EMERGENCY FALLBACK")
+        self._print("-" * 50)
         
         # Test primary admin credentials
         login_data = {"username": "admin", "password": "admin123"}
         url = f"{self.api_url}/auth/login"
         
         try:
-            response = requests.post(url, json=login_data, timeout=30)
+            response = self.session.post(url, json=login_data, timeout=30)
             
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = json_loads(response.content)
                     
                     # Check for access token
                     if 'access_token' in data:
@@ -205,8 +275,8 @@ class AuthDebugTester:
 
     def test_jwt_token_system(self):
         """Test JWT token creation and validation"""
-        print("\n🎫 TESTING JWT TOKEN SYSTEM")
-        print("-" * 50)
+        self._print("\n🎫 TESTING JWT TOKEN SYSTEM")
+        self._print("-" * 50)
         
         if not self.token:
             self.log_test_result(
@@ -219,7 +289,7 @@ class AuthDebugTester:
         try:
             # Decode token without verification to check structure
             # Note: We can't verify signature without knowing the secret
-            decoded_unverified = jwt.decode(self.token, options={"verify_signature": False})
+            decoded_unverified = _decode_unverified(self.token)
             
             # Check for expected fields
             expected_fields = ['username', 'role', 'exp']
@@ -266,8 +336,8 @@ class AuthDebugTester:
 
     def test_token_validation(self):
         """Test token validation by making authenticated request"""
-        print("\n🔒 TESTING TOKEN VALIDATION")
-        print("-" * 50)
+        self._print("\n🔒 TESTING TOKEN VALIDATION")
+        self._print("-" * 50)
         
         if not self.token:
             self.log_test_result(
@@ -282,7 +352,7 @@ class AuthDebugTester:
         headers = {'Authorization': f'Bearer {self.token}'}
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 self.log_test_result(
@@ -316,8 +386,8 @@ class AuthDebugTester:
 
     def test_alternative_admin_credentials(self):
         """Test alternative admin credentials from emergency system"""
-        print("\n🆘 TESTING ALTERNATIVE ADMIN CREDENTIALS")
-        print("-" * 50)
+        self._print("\n🆘 TESTING ALTERNATIVE ADMIN CREDENTIALS")
+        self._print("-" * 50)
         
         # Test alternative emergency credentials
         alt_credentials = [
@@ -325,63 +395,67 @@ class AuthDebugTester:
             {"username": "Gazette", "password": "Gazette2024!"}
         ]
         
+        # Each credential pair is an independent login, so both go out at once.
+        # Bodies are encoded up front so requests skips its own JSON branch.
+        self.run_concurrently(
+            *(functools.partial(self._try_alternative_login, creds, json_dumps(creds))
+              for creds in alt_credentials)
+        )
+
+    def _try_alternative_login(self, creds, body):
+        """Attempt one login from the emergency credential list"""
         url = f"{self.api_url}/auth/login"
         
-        for creds in alt_credentials:
-            try:
-                response = requests.post(url, json=creds, timeout=30)
-                
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        if 'access_token' in data:
-                            self.log_test_result(
-                                f"Alternative Login ({creds['username']})",
-                                True,
-                                f"Role: {data.get('role', 'unknown')}, Message: {data.get('message', '')}"
-                            )
-                        else:
-                            self.log_test_result(
-                                f"Alternative Login ({creds['username']})",
-                                False,
-                                "No access token in response"
-                            )
-                    except json.JSONDecodeError:
+        try:
+            response = self.session.post(url, data=body, headers=JSON_HEADERS, timeout=30)
+            
+            if response.status_code == 200:
+                try:
+                    data = json_loads(response.content)
+                    if 'access_token' in data:
+                        self.log_test_result(
+                            f"Alternative Login ({creds['username']})",
+                            True,
+                            f"Role: {data.get('role', 'unknown')}, Message: {data.get('message', '')}"
+                        )
+                    else:
                         self.log_test_result(
                             f"Alternative Login ({creds['username']})",
                             False,
-                            "Invalid JSON response"
+                            "No access token in response"
                         )
-                else:
+                except json.JSONDecodeError:
                     self.log_test_result(
                         f"Alternative Login ({creds['username']})",
                         False,
-                        f"HTTP {response.status_code}"
+                        "Invalid JSON response"
                     )
-                    
-            except Exception as e:
+            else:
                 self.log_test_result(
                     f"Alternative Login ({creds['username']})",
                     False,
-                    f"Connection error: {str(e)}"
+                    f"HTTP {response.status_code}"
                 )
+                
+        except Exception as e:
+            self.log_test_result(
+                f"Alternative Login ({creds['username']})",
+                False,
+                f"Connection error: {str(e)}"
+            )
 
     def test_enhanced_logging_indicators(self):
         """Test for enhanced logging by checking debug endpoints"""
-        print("\n📝 TESTING ENHANCED LOGGING INDICATORS")
-        print("-" * 50)
+        self._print("\n📝 TESTING ENHANCED LOGGING INDICATORS")
+        self._print("-" * 50)
         
         # The enhanced logging is server-side, but we can check if debug endpoints
         # provide information that indicates logging is working
         
-        url = f"{self.api_url}/debug/auth"
-        
         try:
-            response = requests.get(url, timeout=30)
+            status, data, _ = self._get_debug_auth()
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if status == 200 and data is not None:
                 # Check if we have detailed error information
                 last_error = data.get('last_error')
                 seeding_status = data.get('seeding_status')
@@ -418,7 +492,7 @@ class AuthDebugTester:
                 self.log_test_result(
                     "Enhanced Logging Check",
                     False,
-                    f"Debug endpoint not accessible: {response.status_code}"
+                    f"Debug endpoint not accessible: {status}"
                 )
                 return False
                 
@@ -432,17 +506,13 @@ class AuthDebugTester:
 
     def test_database_connection_handling(self):
         """Test database connection handling through debug endpoint"""
-        print("\n🗄️ TESTING DATABASE CONNECTION HANDLING")
-        print("-" * 50)
-        
-        url = f"{self.api_url}/debug/auth"
+        self._print("\n🗄️ TESTING DATABASE CONNECTION HANDLING")
+        self._print("-" * 50)
         
         try:
-            response = requests.get(url, timeout=30)
+            status, data, _ = self._get_debug_auth()
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if status == 200 and data is not None:
                 db_connected = data.get('db_connected')
                 users = data.get('users', [])
                 total_users = data.get('total_users', 0)
@@ -479,7 +549,7 @@ class AuthDebugTester:
                 self.log_test_result(
                     "Database Connection Check",
                     False,
-                    f"Debug endpoint error: {response.status_code}"
+                    f"Debug endpoint error: {status}"
                 )
                 return False
                 
@@ -497,26 +567,22 @@ class AuthDebugTester:
         print("🎯 Target:", self.base_url)
         print("=" * 80)
         
-        # Test 1: Debug Auth Endpoint (NEW)
-        self.test_debug_auth_endpoint()
-        
-        # Test 2: Admin Login with Emergency Fallback
-        self.test_admin_login_with_fallback()
-        
-        # Test 3: JWT Token System
-        self.test_jwt_token_system()
-        
-        # Test 4: Token Validation
-        self.test_token_validation()
-        
-        # Test 5: Alternative Admin Credentials
-        self.test_alternative_admin_credentials()
-        
-        # Test 6: Enhanced Logging Indicators
-        self.test_enhanced_logging_indicators()
-        
-        # Test 7: Database Connection Handling
-        self.test_database_connection_handling()
+        try:
+            # Admin Login with Emergency Fallback goes first: the JWT and
+            # token validation tests need its token
+            self.test_admin_login_with_fallback()
+            
+            # Everything else is independent I/O, so run it concurrently
+            self.run_concurrently(
+                self.test_debug_auth_endpoint,
+                self.test_jwt_token_system,
+                self.test_token_validation,
+                self.test_alternative_admin_credentials,
+                self.test_enhanced_logging_indicators,
+                self.test_database_connection_handling
+            )
+        finally:
+            self.session.close()
         
         # Summary
         self.print_summary()
@@ -527,31 +593,43 @@ class AuthDebugTester:
         print("📊 AUTHENTICATION DEBUG TEST SUMMARY")
         print("=" * 80)
         
-        print(f"Total Tests Run: {self.tests_run}")
-        print(f"Tests Passed: {self.tests_passed}")
-        print(f"Tests Failed: {self.tests_run - self.tests_passed}")
-        print(f"Success Rate: {(self.tests_passed/self.tests_run)*100:.1f}%")
-        
-        print("\n📋 DETAILED RESULTS:")
-        print("-" * 50)
-        
+        # Check specific priority areas from the review request: an area passes
+        # if any passing test name contains its marker
+        priority_markers = (
+            ("Admin Login", "Admin Login with Emergency Fallback"),
+            ("Debug Auth", "Debug Auth Endpoint"),
+            ("JWT Token", "JWT Token System"),
+            ("Database", "Database Connection Handling"),
+            ("Enhanced Logging", "Enhanced Logging"),
+        )
+        priority_areas = dict.fromkeys((area for _, area in priority_markers), False)
+        
+        # One pass over the results: count passes, format details, classify areas
+        tests_run = len(self.test_results)
+        tests_passed = 0
+        detail_lines = []
         for result in self.test_results:
             status = "✅" if result["success"] else "❌"
-            print(f"{status} {result['name']}")
+            detail_lines.append(f"{status} {result['name']}")
             if result["details"]:
-                print(f"    └─ {result['details']}")
+                detail_lines.append(f"    └─ {result['details']}")
+            if result["success"]:
+                tests_passed += 1
+                for marker, area in priority_markers:
+                    if marker in result["name"]:
+                        priority_areas[area] = True
+        
+        print(f"Total Tests Run: {tests_run}")
+        print(f"Tests Passed: {tests_passed}")
+        print(f"Tests Failed: {tests_run - tests_passed}")
+        print(f"Success Rate: {(tests_passed/tests_run)*100 if tests_run else 0:.1f}%")
         
-        print("\n🎯 PRIORITY TESTING AREAS STATUS:")
+        print("\n📋 DETAILED RESULTS:")
         print("-" * 50)
+        print("\n".join(detail_lines))
         
-        # Check specific priority areas from the review request
-        priority_areas = {
-            "Admin Login with Emergency Fallback": any("Admin Login" in r["name"] for r in self.test_results if r["success"]),
-            "Debug Auth Endpoint": any("Debug Auth" in r["name"] for r in self.test_results if r["success"]),
-            "JWT Token System": any("JWT Token" in r["name"] for r in self.test_results if r["success"]),
-            "Database Connection Handling": any("Database" in r["name"] for r in self.test_results if r["success"]),
-            "Enhanced Logging": any("Enhanced Logging" in r["name"] for r in self.test_results if r["success"])
-        }
+        print("\n🎯 PRIORITY TESTING AREAS STATUS:")
+        print("-" * 50)
         
         for area, status in priority_areas.items():
             print(f"{'✅' if status else '❌'} {area}")
@@ -569,10 +647,10 @@ class AuthDebugTester:
             print("❌ Emergency Fallback: NOT WORKING")
         
         # Overall assessment
-        if self.tests_passed >= self.tests_run * 0.8:  # 80% pass rate
+        if tests_passed >= tests_run * 0.8:  # 80% pass rate
             print("\n🎉 OVERALL ASSESSMENT: AUTHENTICATION FIXES ARE WORKING WELL")
             return 0
-        elif self.tests_passed >= self.tests_run * 0.6:  # 60% pass rate
+        elif tests_passed >= tests_run * 0.6:  # 60% pass rate
             print("\n⚠️  OVERALL ASSESSMENT: AUTHENTICATION FIXES PARTIALLY WORKING")
             return 1
         else:
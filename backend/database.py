@@ -1,4 +1,6 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, Enum as SQLEnum, text
+from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, CheckConstraint, Index, JSON, Uuid, inspect, text, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.sql import func
@@ -6,16 +8,17 @@ from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
+from uuid import UUID
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
 import os
 import bcrypt
+import functools
 import logging
-import re
+import secrets
 import unicodedata
 from datetime import datetime
 from collections import deque
 from dotenv import load_dotenv
-from alembic import command
-from alembic.config import Config
 
 # Global error log ring buffer (for mobile debugging)
 ERROR_LOG_BUFFER = deque(maxlen=20)
@@ -38,63 +41,132 @@ def log_error(message: str, exception: Exception = None):
 # Load environment variables
 load_dotenv()
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+# Set up logging (handlers and level are configured by the application)
 logger = logging.getLogger(__name__)
 
-# Database URL from environment variable with SSL support
+def _ensure_ssl(url: Optional[str]) -> Optional[str]:
+    """Return url with sslmode=require added to the query if it has no sslmode yet
+
+    Pure function: inspects the parsed query instead of substring checks and
+    never writes back to os.environ. Only Postgres URLs are touched.
+    """
+    if not url or not url.startswith("postgres"):
+        return url
+    parts = urlsplit(url)
+    if any(key == "sslmode" for key, _ in parse_qsl(parts.query, keep_blank_values=True)):
+        return url
+    # Append to the raw query so existing parameters keep their exact encoding
+    query = f"{parts.query}&sslmode=require" if parts.query else "sslmode=require"
+    logger.info("🔒 Added sslmode=require to DATABASE_URL")
+    return urlunsplit(parts._replace(query=query))
+
+
+# Database URL from environment variable; SSL mode is forced for production
+# (required for Render Postgres)
 DATABASE_URL = os.getenv('DATABASE_URL')
+DATABASE_URL_WITH_SSL = _ensure_ssl(DATABASE_URL)
 
-# Force-append SSL mode for production (required for Render Postgres)
-if DATABASE_URL:
-    if '?' not in DATABASE_URL:
-        if 'sslmode' not in DATABASE_URL:
-            DATABASE_URL += '?sslmode=require'
-            logger.info(f"🔒 Force-appended ?sslmode=require to DATABASE_URL")
-            # Update environment variable
-            os.environ['DATABASE_URL'] = DATABASE_URL
-    else:
-        if 'sslmode' not in DATABASE_URL:
-            DATABASE_URL += '&sslmode=require'
-            logger.info(f"🔒 Force-appended &sslmode=require to DATABASE_URL") 
-            # Update environment variable
-            os.environ['DATABASE_URL'] = DATABASE_URL
+IS_POSTGRES = bool(DATABASE_URL) and DATABASE_URL.startswith("postgresql")
+
+# sslmode travels in the URL only (see _ensure_ssl), so Alembic's engine gets
+# the same setting and an explicit ?sslmode= in DATABASE_URL is respected
+connect_args = {}
 
-DATABASE_URL_WITH_SSL = DATABASE_URL
+# Pool tuning for Postgres: keep warm connections around so requests don't
+# queue behind the default 5, and recycle them after 5 minutes, well before
+# Render's managed Postgres drops idle connections.
+# LIFO checkout reuses the most recently used connections, letting the rest
+# go idle and get recycled instead of keeping every backend half-warm.
+# Behind PgBouncer in transaction mode set DB_PGBOUNCER=1: the bouncer owns
+# liveness, so skip pre-ping and recycle aggressively.
+USE_PGBOUNCER = os.getenv("DB_PGBOUNCER") == "1"
+pool_args = {}
+if IS_POSTGRES:
+    connect_args["connect_timeout"] = 5
+    pool_args = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "5")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "60" if USE_PGBOUNCER else "300")),
+        "pool_use_lifo": True,
+    }
+
+# Connections opened at startup (see warm_pool) so the first requests after a
+# deploy or restart don't each pay the TCP + TLS + auth handshake
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "5"))
 
 # Create engine with SSL support and connection arguments
 engine = create_engine(
     DATABASE_URL_WITH_SSL,
-    connect_args={"sslmode": "require"} if DATABASE_URL and "localhost" not in DATABASE_URL and "sqlite" not in DATABASE_URL else {},
-    echo=False  # Set to True for SQL debugging
+    connect_args=connect_args,
+    pool_pre_ping=not USE_PGBOUNCER,  # Cheap liveness check so stale sockets never reach a request
+    echo=False,  # Set to True for SQL debugging
+    **pool_args
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=True, bind=engine)
+
+def warm_pool(size: int = DB_POOL_WARM) -> int:
+    """Open up to `size` pooled connections ahead of traffic; returns how many
+
+    Every connection is checked out before any is returned, which forces the
+    pool to create distinct ones instead of handing back the same socket.
+    """
+    if not IS_POSTGRES or size <= 0:
+        return 0
+    connections = []
+    try:
+        for _ in range(min(size, pool_args["pool_size"])):
+            connections.append(engine.connect())
+    except Exception as e:
+        logger.warning(f"⚠️ Connection pool warm-up stopped early: {e}")
+    finally:
+        for conn in connections:
+            conn.close()
+    return len(connections)
+
+# expire_on_commit=False: objects keep their loaded state after commit, so
+# serializing a just-saved row doesn't trigger a re-SELECT (server defaults
+# come back via INSERT ... RETURNING). autoflush stays on so queries see
+# pending changes made earlier in the same request.
+SessionLocal = sessionmaker(autocommit=False, autoflush=True, expire_on_commit=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
 
-# Utility functions for password handling with enhanced bcrypt
+# Utility functions for password handling (Argon2id, legacy bcrypt)
 from passlib.context import CryptContext
 
-# Initialize password context with bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use Argon2id with the OWASP baseline parameters (19 MiB, t=2),
+# ~30ms per verify versus ~250ms for bcrypt cost 12. Existing bcrypt hashes
+# still verify and are marked deprecated, so verify_and_update_password hands
+# back an Argon2id replacement on the next successful login. BCRYPT_ROUNDS
+# only applies to the manual bcrypt fallback below.
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '10'))
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default="argon2",
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=2,
+    bcrypt__rounds=BCRYPT_ROUNDS,
+)
 
 def hash_password(password: str) -> str:
-    """Hash password using passlib bcrypt context"""
+    """Hash password using passlib context (Argon2id)"""
     try:
         hashed = pwd_context.hash(password)
-        logger.debug(f"🔐 Password hashed successfully (length: {len(hashed)})")
+        logger.debug("🔐 Password hashed successfully (length: %d)", len(hashed))
         return hashed
     except Exception as e:
         logger.error(f"❌ Password hashing failed: {e}")
         # Fallback to manual bcrypt
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, password_hash: str) -> bool:
     """Verify password against hash using passlib"""
     try:
         result = pwd_context.verify(password, password_hash)
-        logger.debug(f"🔐 Password verification: {'✅ SUCCESS' if result else '❌ FAILED'}")
+        logger.debug("🔐 Password verification: %s", '✅ SUCCESS' if result else '❌ FAILED')
         return result
     except Exception as e:
         logger.error(f"❌ Password verification error: {e}")
@@ -103,38 +175,93 @@ def verify_password(password: str, password_hash: str) -> bool:
             return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
         except Exception as e2:
             logger.error(f"❌ Fallback verification failed: {e2}")
+            dummy_verify_password()
             return False
 
-def generate_slug(title: str, db_session=None) -> str:
-    """Generate SEO-friendly slug from article title"""
-    # Normalize unicode characters
-    slug = unicodedata.normalize('NFKD', title)
-    
-    # Convert to lowercase and replace spaces with hyphens
-    slug = slug.lower().replace(' ', '-')
-    
-    # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r'[^a-z0-9\-]', '', slug)
-    
-    # Remove multiple consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
+def verify_and_update_password(password: str, password_hash: str):
+    """Verify password and return (valid, new_hash); new_hash is set when the
+    stored hash uses a deprecated scheme and should be replaced"""
+    try:
+        return pwd_context.verify_and_update(password, password_hash)
+    except Exception as e:
+        logger.error(f"❌ Password verification error: {e}")
+        # passlib's bcrypt backend can fail on newer bcrypt releases; check the
+        # legacy hash directly and upgrade it if it matches
+        try:
+            valid = bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+        except Exception as e2:
+            logger.error(f"❌ Fallback verification failed: {e2}")
+            dummy_verify_password()
+            return False, None
+        return valid, (hash_password(password) if valid else None)
+
+def dummy_verify_password() -> None:
+    """Burn the time of one real password verify without checking anything
+
+    Called on paths that have no usable hash (unknown user, unreadable hash)
+    so they take as long as a wrong password and timing can't tell them apart.
+    """
+    try:
+        pwd_context.dummy_verify()
+    except Exception as e:
+        logger.error(f"❌ Dummy password verification failed: {e}")
+
+# Seed users hash their default passwords at most once per process; a deploy can
+# also bake precomputed bcrypt hashes into SEED_ADMIN_HASH / SEED_BACKUP_HASH
+@functools.lru_cache(maxsize=None)
+def seed_password_hash(password: str) -> str:
+    return hash_password(password)
+
+def seed_admin_hash() -> str:
+    return os.getenv('SEED_ADMIN_HASH') or seed_password_hash("admin123")
+
+def seed_backup_hash() -> str:
+    return os.getenv('SEED_BACKUP_HASH') or seed_password_hash("admin_backup")
+
+# Slug character map for str.translate: keeps a-z/0-9, turns hyphens and
+# whitespace into spaces (word breaks) and deletes all other ASCII
+_SLUG_TABLE = str.maketrans({
+    chr(code): (
+        chr(code) if chr(code).isalnum()
+        else ' ' if chr(code) == '-' or chr(code).isspace()
+        else None
+    )
+    for code in range(128)
+})
+
+def generate_slug(title: str, db_session=None, existing_slugs: Optional[set] = None) -> str:
+    """Generate SEO-friendly slug from article title
+
+    Pass existing_slugs (a set of slugs already taken) to check uniqueness in
+    memory instead of querying; the chosen slug is added to the set.
+    """
+    # Decompose accents and drop everything non-ASCII (é -> e), then lowercase
+    slug = unicodedata.normalize('NFKD', title).encode('ascii', 'ignore').decode('ascii').lower()
     
-    # Remove leading/trailing hyphens
-    slug = slug.strip('-')
+    # One translate pass filters the characters; split/join collapses runs of
+    # separators into single hyphens and trims them from both ends
+    slug = '-'.join(slug.translate(_SLUG_TABLE).split())
     
-    # Truncate to 100 characters
-    slug = slug[:100]
+    # Truncate to 100 characters (without leaving a dangling hyphen)
+    slug = slug[:100].rstrip('-')
     
     # Ensure slug is not empty
     if not slug:
         slug = 'article'
     
-    # Check for uniqueness if database session provided
-    if db_session:
+    # Check for uniqueness against the known slugs or the database
+    if existing_slugs is not None:
+        slug_taken = lambda candidate: candidate in existing_slugs
+    elif db_session:
+        slug_taken = lambda candidate: db_session.query(DBArticle.id).filter(DBArticle.slug == candidate).first() is not None
+    else:
+        slug_taken = None
+    
+    if slug_taken:
         original_slug = slug
         counter = 1
         
-        while db_session.query(DBArticle).filter(DBArticle.slug == slug).first():
+        while slug_taken(slug):
             slug = f"{original_slug}-{counter}"
             counter += 1
             
@@ -143,6 +270,9 @@ def generate_slug(title: str, db_session=None) -> str:
                 slug = f"{original_slug}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
                 break
     
+    if existing_slugs is not None:
+        existing_slugs.add(slug)
+    
     logger.info(f"📝 Generated slug: '{title}' -> '{slug}'")
     return slug
 
@@ -177,41 +307,99 @@ class UserRole(str, Enum):
 # SQLAlchemy Models
 class DBUser(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        CheckConstraint("role IN ('admin', 'user')", name='ck_users_role'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=True)
     password_hash = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), default=UserRole.USER, nullable=False)
+    role = Column(String(20), default=UserRole.USER.value, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 class DBArticle(Base):
     __tablename__ = "articles"
+    # Plain strings + CHECK instead of native PG ENUM types; the Python enums
+    # are still used for validation at the Pydantic layer (see migration 006)
+    __table_args__ = (
+        CheckConstraint("category IN ('news', 'music', 'documentaries', 'comedy')", name='ck_articles_category'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    uuid = Column(String(36), unique=True, index=True, nullable=False)  # Keep UUID for internal use
+    # Native UUID on PostgreSQL, str in Python. SQLite keeps the dashed
+    # String(36) form its existing rows use (migration 007 is PostgreSQL-only),
+    # since Uuid there would store and bind 32-char hex
+    uuid = Column(Uuid(as_uuid=False).with_variant(String(36), 'sqlite'), unique=True, index=True, nullable=False)
     slug = Column(String(255), unique=True, index=True, nullable=False)  # SEO-friendly URL slug
     title = Column(String(255), nullable=False)
     subheading = Column(String(500), nullable=True)
     content = Column(Text, nullable=False)
-    category = Column(SQLEnum(ArticleCategory), nullable=False)
+    category = Column(String(20), nullable=False)
     publisher_name = Column(String(100), default="The Crewkerne Gazette")
     author_name = Column(String(100), nullable=True)
     author_id = Column(String(50), nullable=True)
     featured_image = Column(String(500), nullable=True)  # URL to image
     image_caption = Column(String(255), nullable=True)
     video_url = Column(String(500), nullable=True)
-    tags = Column(Text, nullable=True)  # JSON string of comma-separated tags
-    category_labels = Column(Text, nullable=True)  # JSON string of article category labels
+    tags = Column(JSONB().with_variant(JSON(), 'sqlite'), nullable=True)  # List of tag strings (JSONB on PostgreSQL)
+    category_labels = Column(JSONB().with_variant(JSON(), 'sqlite'), nullable=True)  # List of label strings (JSONB on PostgreSQL)
     is_breaking = Column(Boolean, default=False, nullable=False)
     is_published = Column(Boolean, default=True, nullable=False)
     pinned_at = Column(DateTime(timezone=True), nullable=True)
     priority = Column(Integer, default=0, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+# Article list indexes (see migration 004): category listings ordered newest first
+Index('ix_articles_category_created', DBArticle.category, DBArticle.created_at.desc())
+
+# Published and breaking articles by recency, as partial indexes holding only
+# the matching rows rather than full indexes led by a boolean (migration 012)
+Index(
+    'ix_articles_published_recent', DBArticle.created_at.desc(),
+    postgresql_where=DBArticle.is_published == True,
+).ddl_if(dialect='postgresql')
+Index(
+    'ix_articles_breaking_recent', DBArticle.created_at.desc(),
+    postgresql_where=DBArticle.is_breaking == True,
+).ddl_if(dialect='postgresql')
+
+# Homepage/top-rail feed order: pinned first (newest pin wins), then priority,
+# breaking, newest. "pinned_at DESC NULLS LAST" is the index-friendly spelling
+# of "pinned_at IS NOT NULL DESC, pinned_at DESC", so the composite partial
+# index below hands rows over pre-sorted (migration 009). Its NULLS LAST
+# columns are PostgreSQL-only syntax.
+ARTICLE_FEED_ORDER = (
+    DBArticle.pinned_at.desc().nulls_last(),
+    DBArticle.priority.desc(),
+    DBArticle.is_breaking.desc(),
+    DBArticle.created_at.desc(),
+)
+Index(
+    'ix_articles_feed', *ARTICLE_FEED_ORDER,
+    postgresql_where=DBArticle.is_published == True,
+).ddl_if(dialect='postgresql')
+# Category pages run the same feed query with "AND category = ?" (migration 011)
+Index(
+    'ix_articles_category_feed', DBArticle.category, *ARTICLE_FEED_ORDER,
+    postgresql_where=DBArticle.is_published == True,
+).ddl_if(dialect='postgresql')
+
+# Dashboard "my articles" list: author_id filter, newest first (migration 011)
+Index('ix_articles_author_created', DBArticle.author_id, DBArticle.created_at.desc())
+
+# GIN index so tag containment filters (tags @> '["x"]') use an index probe (see migration 005)
+Index('ix_articles_tags_gin', DBArticle.tags, postgresql_using='gin')
+
+# Articles arrive in created_at order, so a BRIN index lets date-range scans
+# (news sitemap, archives) skip whole block ranges of older rows - the pruning
+# benefit of yearly partitions without giving up the unique uuid/slug indexes,
+# which PostgreSQL can't keep on a table partitioned by created_at (migration 008)
+Index('ix_articles_created_brin', DBArticle.created_at, postgresql_using='brin').ddl_if(dialect='postgresql')
+
 class DBContact(Base):
     __tablename__ = "contacts"
     
@@ -292,9 +480,181 @@ def get_db():
     finally:
         db.close()
 
+def get_article_by_uuid(db: Session, article_uuid: str):
+    """Look up an article by UUID; malformed UUIDs are treated as not found"""
+    try:
+        UUID(str(article_uuid))
+    except ValueError:
+        return None
+    return db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
+
+def add_article_with_unique_slug(db: Session, article, attempts: int = 3):
+    """Insert and commit a new article, letting the unique slug index decide
+    collisions: on a slug conflict retry with a short random suffix instead
+    of probing for a free slug with a query per candidate"""
+    base_slug = article.slug
+    for attempt in range(attempts):
+        try:
+            with db.begin_nested():
+                db.add(article)
+                db.flush()
+            db.commit()
+            return article
+        except IntegrityError as e:
+            if 'slug' not in str(e.orig) or attempt == attempts - 1:
+                raise
+            article.slug = f"{base_slug}-{secrets.token_hex(3)}"
+            logger.info(f"📝 Slug '{base_slug}' taken, retrying as '{article.slug}'")
+
+def _insert_ignoring_conflicts(model, rows, key_column):
+    """INSERT ... ON CONFLICT (key_column) DO NOTHING for PostgreSQL and SQLite"""
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model).values(rows).on_conflict_do_nothing(index_elements=[key_column])
+
 # Initialize database
-def init_database():
-    """Create tables and initial data with enhanced seeding"""
+# Seeding re-verifies freshly written admin hashes only when DEBUG_SEED=1:
+# each check is a full password-hash verify on the startup path
+_DEBUG_SEED = os.getenv("DEBUG_SEED") == "1"
+
+# SKIP_STARTUP_SEED=1 leaves out the seed users, default settings and slug
+# backfill (and the admin password verify they start with) on every boot.
+# Meant for deployments that seed once as a release step instead, e.g.
+#   python -c "from database import init_database; init_database(seed=True)"
+_SKIP_STARTUP_SEED = os.getenv("SKIP_STARTUP_SEED") == "1"
+
+# Set once the schema has been created/verified in this process, so repeat
+# init_database() calls skip the catalog inspection entirely
+_DB_INITIALIZED = False
+
+# Settings row recording the Alembic head the schema was last brought up to;
+# when it matches the code's head, warm boots skip schema work altogether
+SCHEMA_READY_KEY = "schema_ready"
+
+# Arbitrary app-wide key for the PostgreSQL advisory lock that elects the one
+# worker allowed to migrate and seed when several start at once
+_INIT_LOCK_KEY = 7393274
+
+def _alembic_head():
+    """Return the head revision of the bundled migration scripts"""
+    # Alembic is only needed at startup; importing it lazily keeps it (and
+    # Mako) out of plain `import database` for scripts and tools
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    return ScriptDirectory.from_config(Config("alembic.ini")).get_current_head()
+
+def _schema_revision():
+    """Return the schema_ready marker stored in settings, or None if unavailable"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                text("SELECT value FROM settings WHERE key = :key"), {"key": SCHEMA_READY_KEY}
+            ).scalar()
+    except Exception:
+        # Fresh database: the settings table doesn't exist yet
+        return None
+
+def _mark_schema_ready(revision):
+    """Record that the schema is at the given Alembic revision"""
+    with engine.begin() as conn:
+        conn.execute(_insert_ignoring_conflicts(
+            DBSettings, [{"key": SCHEMA_READY_KEY, "value": revision}], "key"
+        ))
+        conn.execute(
+            text("UPDATE settings SET value = :value WHERE key = :key"),
+            {"key": SCHEMA_READY_KEY, "value": revision},
+        )
+
+def _ensure_schema():
+    """Create missing tables, patch legacy columns and run Alembic migrations"""
+    global _DB_INITIALIZED
+    try:
+        head = _alembic_head()
+    except Exception as head_error:
+        logger.warning(f"⚠️ Could not read migration head: {head_error}")
+        head = None
+    if head and _schema_revision() == head:
+        logger.info(f"✅ Database schema already at {head}; skipping migrations")
+        _DB_INITIALIZED = True
+        return
+    
+    # Create base tables first, skipping the per-table DDL checks when a
+    # single catalog lookup shows every model table already exists
+    existing_tables = set(inspect(engine).get_table_names())
+    if set(Base.metadata.tables) - existing_tables:
+        Base.metadata.create_all(bind=engine, checkfirst=True)
+    logger.info("✅ Database tables created/verified")
+    
+    # Manually add columns that might be missing in existing databases
+    try:
+        with engine.connect() as conn:
+            # Add upvotes column to trending_opinions if missing
+            try:
+                conn.execute(text("SELECT upvotes FROM trending_opinions LIMIT 1"))
+            except Exception:
+                logger.info("Adding upvotes column to trending_opinions...")
+                conn.execute(text("ALTER TABLE trending_opinions ADD COLUMN upvotes INTEGER DEFAULT 0"))
+                conn.commit()
+                logger.info("✅ Added upvotes column")
+            
+            # Add downvotes column to trending_opinions if missing
+            try:
+                conn.execute(text("SELECT downvotes FROM trending_opinions LIMIT 1"))
+            except Exception:
+                logger.info("Adding downvotes column to trending_opinions...")
+                conn.execute(text("ALTER TABLE trending_opinions ADD COLUMN downvotes INTEGER DEFAULT 0"))
+                conn.commit()
+                logger.info("✅ Added downvotes column")
+    except Exception as col_error:
+        logger.warning(f"⚠️ Column migration warning: {col_error}")
+    
+    # Run Alembic migrations to add any new columns/indexes
+    try:
+        from alembic import command
+        from alembic.config import Config
+        alembic_cfg = Config("alembic.ini")
+        command.upgrade(alembic_cfg, "head")
+        logger.info("✅ Database migrations applied successfully")
+        if head:
+            _mark_schema_ready(head)
+        _DB_INITIALIZED = True
+    except Exception as migration_error:
+        logger.warning(f"⚠️ Migration warning: {migration_error}")
+        # Don't fail completely if migrations have issues
+        # This allows the app to work even if migrations can't run
+
+def init_database(seed: Optional[bool] = None):
+    """Create tables and initial data with enhanced seeding
+
+    On PostgreSQL only one worker at a time runs this: the others find the
+    advisory lock taken and return "skipped" straight away instead of queueing
+    behind the same migrations and seeding. seed defaults to on unless
+    SKIP_STARTUP_SEED=1.
+    """
+    if seed is None:
+        seed = not _SKIP_STARTUP_SEED
+    if not IS_POSTGRES:
+        return _init_database(seed)
+    
+    try:
+        with engine.connect() as lock_conn, lock_conn.begin():
+            # Transaction-scoped lock: released on commit/rollback, even if
+            # this worker dies, and safe behind PgBouncer transaction pooling
+            acquired = lock_conn.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _INIT_LOCK_KEY}
+            ).scalar()
+            if not acquired:
+                logger.info("⏭️ Another worker is initializing the database; skipping")
+                return "skipped", None
+            return _init_database(seed)
+    except Exception as e:
+        logger.error(f"❌ Database connection failed: {e}")
+        return "failure", str(e)
+
+def _init_database(seed: bool = True):
+    """Run schema setup and seeding (on PostgreSQL the caller holds the init lock)"""
     logger.info("🔄 Starting database initialization...")
     seeding_status = "success"
     last_error = None
@@ -311,42 +671,10 @@ def init_database():
         return seeding_status, last_error
     
     try:
-        # Create base tables first
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ Database tables created/verified")
-        
-        # Manually add columns that might be missing in existing databases
-        try:
-            with engine.connect() as conn:
-                # Add upvotes column to trending_opinions if missing
-                try:
-                    conn.execute(text("SELECT upvotes FROM trending_opinions LIMIT 1"))
-                except Exception:
-                    logger.info("Adding upvotes column to trending_opinions...")
-                    conn.execute(text("ALTER TABLE trending_opinions ADD COLUMN upvotes INTEGER DEFAULT 0"))
-                    conn.commit()
-                    logger.info("✅ Added upvotes column")
-                
-                # Add downvotes column to trending_opinions if missing
-                try:
-                    conn.execute(text("SELECT downvotes FROM trending_opinions LIMIT 1"))
-                except Exception:
-                    logger.info("Adding downvotes column to trending_opinions...")
-                    conn.execute(text("ALTER TABLE trending_opinions ADD COLUMN downvotes INTEGER DEFAULT 0"))
-                    conn.commit()
-                    logger.info("✅ Added downvotes column")
-        except Exception as col_error:
-            logger.warning(f"⚠️ Column migration warning: {col_error}")
-        
-        # Run Alembic migrations to add any new columns/indexes
-        try:
-            alembic_cfg = Config("alembic.ini")
-            command.upgrade(alembic_cfg, "head")
-            logger.info("✅ Database migrations applied successfully")
-        except Exception as migration_error:
-            logger.warning(f"⚠️ Migration warning: {migration_error}")
-            # Don't fail completely if migrations have issues
-            # This allows the app to work even if migrations can't run
+        if not _DB_INITIALIZED:
+            _ensure_schema()
+        else:
+            logger.info("✅ Database schema already verified in this process")
             
     except Exception as e:
         logger.error(f"❌ Failed to create database tables: {e}")
@@ -354,70 +682,91 @@ def init_database():
         last_error = str(e)
         return seeding_status, last_error
     
+    if not seed:
+        logger.info("⏭️ Startup seeding disabled (SKIP_STARTUP_SEED=1); skipping seed users, settings and slug backfill")
+        return seeding_status, last_error
+    
     # Create initial admin user and settings
     db = SessionLocal()
     try:
-        # Check existing users
-        existing_users_count = db.query(DBUser).count()
-        logger.info(f"📊 Existing users in database: {existing_users_count}")
+        # Check existing users (diagnostic only; DEBUG_SEED=1)
+        if _DEBUG_SEED:
+            logger.info(f"📊 Existing users in database: {db.query(DBUser).count()}")
+        
+        # Fetch both seed users in one round-trip
+        seed_users = {
+            user.username: user
+            for user in db.query(DBUser).filter(DBUser.username.in_(["admin", "admin_backup"])).all()
+        }
         
         # Handle admin user with force reset capability
-        admin_user = db.query(DBUser).filter(DBUser.username == "admin").first()
+        admin_user = seed_users.get("admin")
+        verified_hash = None  # Admin hash already checked this run (skip re-verifying it)
         
         if admin_user:
             logger.info("👤 Admin user exists, verifying password...")
-            # Test current password
-            password_valid = verify_password("admin123", admin_user.password_hash)
+            # Test current password (and move a legacy bcrypt hash to Argon2id)
+            password_valid, upgraded_hash = verify_and_update_password("admin123", admin_user.password_hash)
+            if password_valid and upgraded_hash:
+                admin_user.password_hash = upgraded_hash
+                db.commit()
+                logger.info("🔐 Admin password hash upgraded to Argon2id")
             
             if not password_valid:
                 logger.warning("⚠️ Admin password verification failed, resetting...")
                 # Force password reset
-                new_hash = hash_password("admin123")
+                new_hash = seed_admin_hash()
                 admin_user.password_hash = new_hash
-                admin_user.role = UserRole.ADMIN
+                admin_user.role = UserRole.ADMIN.value
                 admin_user.is_active = True
                 db.commit()
                 logger.info("✅ Admin password reset successfully")
                 
-                # Verify reset worked
-                reset_check = verify_password("admin123", admin_user.password_hash)
-                logger.info(f"🔐 Password reset verification: {'✅ SUCCESS' if reset_check else '❌ FAILED'}")
+                # Verify reset worked (diagnostic only: a full hash verify)
+                if _DEBUG_SEED:
+                    reset_check = verify_password("admin123", admin_user.password_hash)
+                    logger.info(f"🔐 Password reset verification: {'✅ SUCCESS' if reset_check else '❌ FAILED'}")
+                    if reset_check:
+                        verified_hash = admin_user.password_hash
             else:
                 logger.info("✅ Admin password is valid")
+                verified_hash = admin_user.password_hash
         else:
             logger.info("👤 Creating new admin user...")
             # Create new admin user
-            admin_hash = hash_password("admin123")
+            admin_hash = seed_admin_hash()
             admin_user = DBUser(
                 username="admin",
                 email="admin@crewkernegazette.co.uk",
                 password_hash=admin_hash,
-                role=UserRole.ADMIN,
+                role=UserRole.ADMIN.value,
                 is_active=True
             )
             db.add(admin_user)
             db.commit()
-            db.refresh(admin_user)
             logger.info("✅ Admin user created successfully")
             
-            # Verify creation worked
-            creation_check = verify_password("admin123", admin_user.password_hash)
-            logger.info(f"🔐 New admin verification: {'✅ SUCCESS' if creation_check else '❌ FAILED'}")
+            # Verify creation worked (diagnostic only: a full hash verify)
+            if _DEBUG_SEED:
+                creation_check = verify_password("admin123", admin_user.password_hash)
+                logger.info(f"🔐 New admin verification: {'✅ SUCCESS' if creation_check else '❌ FAILED'}")
+                if creation_check:
+                    verified_hash = admin_user.password_hash
         
         # Handle backup admin user (optional)
         try:
-            backup_user = db.query(DBUser).filter(DBUser.username == "admin_backup").first()
+            backup_user = seed_users.get("admin_backup")
             if not backup_user:
                 logger.info("👤 Creating backup admin user...")
-                backup_hash = hash_password("admin_backup")
-                backup_user = DBUser(
-                    username="admin_backup", 
-                    email="backup@crewkernegazette.co.uk",
-                    password_hash=backup_hash,
-                    role=UserRole.ADMIN,
-                    is_active=True
-                )
-                db.add(backup_user)
+                # ON CONFLICT DO NOTHING: a worker starting in parallel may have
+                # inserted it since our SELECT
+                db.execute(_insert_ignoring_conflicts(DBUser, [{
+                    "username": "admin_backup",
+                    "email": "backup@crewkernegazette.co.uk",
+                    "password_hash": seed_backup_hash(),
+                    "role": UserRole.ADMIN.value,
+                    "is_active": True,
+                }], "username"))
                 db.commit()
                 logger.info("✅ Backup admin user created")
             else:
@@ -432,44 +781,52 @@ def init_database():
             ("breaking_news_text", "Welcome to The Crewkerne Gazette - Your trusted source for local news")
         ]
         
-        for key, value in settings_defaults:
-            setting = db.query(DBSettings).filter(DBSettings.key == key).first()
-            if not setting:
-                setting = DBSettings(key=key, value=value)
-                db.add(setting)
-        
+        # One multi-row INSERT that leaves existing keys untouched
+        db.execute(_insert_ignoring_conflicts(
+            DBSettings, [{"key": key, "value": value} for key, value in settings_defaults], "key"
+        ))
         db.commit()
         
         # Final verification
-        final_user_count = db.query(DBUser).count()
-        admin_final = db.query(DBUser).filter(DBUser.username == "admin").first()
+        admin_final = admin_user
         
-        logger.info(f"📊 Final user count: {final_user_count}")
+        if _DEBUG_SEED:
+            logger.info(f"📊 Final user count: {db.query(DBUser).count()}")
         logger.info(f"👤 Admin user ID: {admin_final.id if admin_final else 'NOT FOUND'}")
         logger.info(f"🔐 Admin role: {admin_final.role if admin_final else 'N/A'}")
         logger.info(f"✅ Admin is_active: {admin_final.is_active if admin_final else 'N/A'}")
         
-        # Final password test
-        if admin_final:
-            final_test = verify_password("admin123", admin_final.password_hash)
+        # Final password test (diagnostic only; DEBUG_SEED=1)
+        if admin_final and _DEBUG_SEED:
+            final_test = admin_final.password_hash == verified_hash or verify_password("admin123", admin_final.password_hash)
             logger.info(f"🔐 Final password test: {'✅ PASS' if final_test else '❌ FAIL'}")
             if not final_test:
                 logger.error("❌ CRITICAL: Final password test failed!")
         
         # Backfill slugs for existing articles that don't have them
         try:
-            articles_without_slugs = db.query(DBArticle).filter(
+            articles_without_slugs = db.query(DBArticle.id, DBArticle.title).filter(
                 (DBArticle.slug.is_(None)) | (DBArticle.slug == '')
             ).all()
             
             if articles_without_slugs:
                 logger.info(f"🔄 Backfilling slugs for {len(articles_without_slugs)} articles...")
                 
-                for article in articles_without_slugs:
-                    new_slug = generate_slug(article.title, db)
-                    article.slug = new_slug
-                    logger.info(f"🏷️ Generated slug for '{article.title}' -> '{new_slug}'")
+                # Load the taken slugs once and check candidates in memory
+                existing_slugs = {
+                    slug for (slug,) in db.query(DBArticle.slug).filter(
+                        DBArticle.slug.isnot(None), DBArticle.slug != ''
+                    ).all()
+                }
+                
+                slug_updates = []
+                for article_id, title in articles_without_slugs:
+                    new_slug = generate_slug(title, existing_slugs=existing_slugs)
+                    slug_updates.append({"id": article_id, "slug": new_slug})
+                    logger.debug("🏷️ Generated slug for '%s' -> '%s'", title, new_slug)
                 
+                # Bulk UPDATE by primary key; the driver batches these into few round-trips
+                db.execute(update(DBArticle), slug_updates)
                 db.commit()
                 logger.info("✅ Slug backfill completed successfully")
             else:
@@ -14,17 +14,18 @@ branch_labels = None
 depends_on = None
 
 def upgrade():
-    # Add upvotes column if it doesn't exist
-    try:
-        op.add_column('trending_opinions', sa.Column('upvotes', sa.Integer(), nullable=True, server_default='0'))
-    except Exception as e:
-        print(f"Column 'upvotes' may already exist: {e}")
-    
-    # Add downvotes column if it doesn't exist
-    try:
-        op.add_column('trending_opinions', sa.Column('downvotes', sa.Integer(), nullable=True, server_default='0'))
-    except Exception as e:
-        print(f"Column 'downvotes' may already exist: {e}")
+    # Check if columns exist before adding; a failed ADD COLUMN aborts the
+    # whole transaction on PostgreSQL, so try/except is not enough here
+    conn = op.get_bind()
+
+    for column in ('upvotes', 'downvotes'):
+        result = conn.execute(sa.text("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name = 'trending_opinions' AND column_name = :column
+        """), {'column': column})
+
+        if not result.fetchone():
+            op.add_column('trending_opinions', sa.Column(column, sa.Integer(), nullable=True, server_default='0'))
 
 def downgrade():
     try:
@@ -0,0 +1,42 @@
+"""Add indexes for article list queries
+
+Revision ID: 004_add_article_list_indexes
+Revises: 003_add_category_labels, 002_add_opinion_votes
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_add_article_list_indexes'
+# Also merges the 002_add_opinion_votes branch so "upgrade head" has a single head
+down_revision = ('003_add_category_labels', '002_add_opinion_votes')
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Public listings filter on is_published / category and sort newest first
+    op.create_index('ix_articles_created_at', 'articles', ['created_at'], if_not_exists=True)
+    op.create_index(
+        'ix_articles_published_created', 'articles',
+        ['is_published', sa.text('created_at DESC')], if_not_exists=True
+    )
+    op.create_index(
+        'ix_articles_category_created', 'articles',
+        ['category', sa.text('created_at DESC')], if_not_exists=True
+    )
+    
+    # Only a handful of articles are breaking, so index just those rows
+    op.create_index(
+        'ix_articles_breaking', 'articles', ['is_breaking'],
+        postgresql_where=sa.text('is_breaking IS TRUE'), if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_articles_breaking', table_name='articles', if_exists=True)
+    op.drop_index('ix_articles_category_created', table_name='articles', if_exists=True)
+    op.drop_index('ix_articles_published_created', table_name='articles', if_exists=True)
+    op.drop_index('ix_articles_created_at', table_name='articles', if_exists=True)
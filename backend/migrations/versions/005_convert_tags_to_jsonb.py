@@ -0,0 +1,70 @@
+"""Convert articles.tags from JSON text to JSONB
+
+Revision ID: 005_convert_tags_to_jsonb
+Revises: 004_add_article_list_indexes
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_convert_tags_to_jsonb'
+down_revision = '004_add_article_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def _normalize_tags(raw):
+    """Parse a legacy tags value into a JSON list string (or None if empty)"""
+    if not raw or not raw.strip():
+        return None
+    try:
+        tags = json.loads(raw)
+    except ValueError:
+        # Older rows may hold a bare comma-separated string
+        tags = raw.split(',')
+    if not isinstance(tags, list):
+        tags = [tags]
+    tags = [str(tag).strip() for tag in tags if tag is not None and str(tag).strip()]
+    return json.dumps(tags) if tags else None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        # Other backends keep storing JSON as text
+        return
+
+    # Only convert if the column is still plain text
+    result = conn.execute(sa.text("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'articles' AND column_name = 'tags'
+    """))
+    row = result.fetchone()
+
+    if row and row[0] == 'text':
+        # Rewrite anything that isn't a clean JSON list so the cast below can't fail
+        rows = conn.execute(sa.text("SELECT id, tags FROM articles WHERE tags IS NOT NULL")).fetchall()
+        for article_id, raw in rows:
+            normalized = _normalize_tags(raw)
+            if normalized != raw:
+                conn.execute(
+                    sa.text("UPDATE articles SET tags = :tags WHERE id = :id"),
+                    {"tags": normalized, "id": article_id},
+                )
+
+        op.execute("ALTER TABLE articles ALTER COLUMN tags TYPE JSONB USING tags::jsonb")
+
+    op.create_index('ix_articles_tags_gin', 'articles', ['tags'], postgresql_using='gin', if_not_exists=True)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_articles_tags_gin', table_name='articles', if_exists=True)
+    op.execute("ALTER TABLE articles ALTER COLUMN tags TYPE TEXT USING tags::text")
@@ -0,0 +1,75 @@
+"""Replace native ENUM columns with strings + CHECK constraints
+
+Revision ID: 006_enum_columns_to_strings
+Revises: 005_convert_tags_to_jsonb
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_enum_columns_to_strings'
+down_revision = '005_convert_tags_to_jsonb'
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type name, allowed values, constraint name)
+ENUM_COLUMNS = [
+    ('users', 'role', 'userrole', ('admin', 'user'), 'ck_users_role'),
+    ('articles', 'category', 'articlecategory', ('news', 'music', 'documentaries', 'comedy'), 'ck_articles_category'),
+]
+
+
+def _in_clause(column, values):
+    return "%s IN (%s)" % (column, ", ".join("'%s'" % value for value in values))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        # SQLite never had native enum types, but the stored names still need lowering
+        for table, column, *_ in ENUM_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = lower({column})")
+        return
+
+    for table, column, enum_name, values, constraint in ENUM_COLUMNS:
+        # Check if the column still uses the native enum type
+        result = conn.execute(sa.text("""
+            SELECT data_type FROM information_schema.columns
+            WHERE table_name = :table AND column_name = :column
+        """), {"table": table, "column": column})
+        row = result.fetchone()
+
+        if row and row[0] == 'USER-DEFINED':
+            # SQLAlchemy stored enum member names (NEWS, ADMIN); store the values instead
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT, "
+                f"ALTER COLUMN {column} TYPE VARCHAR(20) USING lower({column}::text)"
+            )
+            op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+        result = conn.execute(sa.text("""
+            SELECT constraint_name FROM information_schema.table_constraints
+            WHERE table_name = :table AND constraint_name = :constraint
+        """), {"table": table, "constraint": constraint})
+
+        if not result.fetchone():
+            op.create_check_constraint(constraint, table, _in_clause(column, values))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        for table, column, *_ in ENUM_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = upper({column})")
+        return
+
+    for table, column, enum_name, values, constraint in ENUM_COLUMNS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}")
+        labels = ", ".join("'%s'" % value.upper() for value in values)
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({labels})")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_name} "
+            f"USING upper({column})::{enum_name}"
+        )
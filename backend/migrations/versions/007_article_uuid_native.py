@@ -0,0 +1,41 @@
+"""Store articles.uuid as a native UUID column
+
+Revision ID: 007_article_uuid_native
+Revises: 006_enum_columns_to_strings
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_article_uuid_native'
+down_revision = '006_enum_columns_to_strings'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        # SQLite has no native UUID type; values stay as strings
+        return
+
+    # Only convert if the column is still a varchar
+    result = conn.execute(sa.text("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'articles' AND column_name = 'uuid'
+    """))
+    row = result.fetchone()
+
+    if row and row[0] == 'character varying':
+        # The unique index on uuid is rebuilt automatically with the narrower type
+        op.execute("ALTER TABLE articles ALTER COLUMN uuid TYPE UUID USING uuid::uuid")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE articles ALTER COLUMN uuid TYPE VARCHAR(36) USING uuid::text")
@@ -0,0 +1,37 @@
+"""Add a BRIN index on articles.created_at
+
+Revision ID: 008_add_article_created_brin
+Revises: 007_article_uuid_native
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_add_article_created_brin'
+down_revision = '007_article_uuid_native'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        # BRIN is PostgreSQL-only; the btree created_at index covers SQLite
+        return
+
+    # Range partitioning by created_at would require created_at in every unique
+    # constraint (uuid, slug), so use block-range pruning via BRIN instead
+    op.create_index(
+        'ix_articles_created_brin', 'articles', ['created_at'],
+        postgresql_using='brin', if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_articles_created_brin', table_name='articles', if_exists=True)
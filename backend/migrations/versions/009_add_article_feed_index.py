@@ -0,0 +1,49 @@
+"""Add a composite index matching the article feed ordering
+
+Revision ID: 009_add_article_feed_index
+Revises: 008_add_article_created_brin
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_add_article_feed_index'
+down_revision = '008_add_article_created_brin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        # NULLS LAST index columns and partial indexes are PostgreSQL-only here
+        return
+
+    # Same column order as the feed's ORDER BY so the planner can walk the
+    # index instead of sorting; only published articles are ever listed
+    op.create_index(
+        'ix_articles_feed', 'articles',
+        [
+            sa.text('pinned_at DESC NULLS LAST'),
+            sa.text('priority DESC'),
+            sa.text('is_breaking DESC'),
+            sa.text('created_at DESC'),
+        ],
+        postgresql_where=sa.text('is_published'), if_not_exists=True,
+    )
+
+    # Superseded by the composite index (pinned_at stays its leading column)
+    op.drop_index('ix_articles_pinned_at', table_name='articles', if_exists=True)
+    op.drop_index('ix_articles_priority', table_name='articles', if_exists=True)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.create_index('ix_articles_priority', 'articles', ['priority'], if_not_exists=True)
+    op.create_index('ix_articles_pinned_at', 'articles', ['pinned_at'], if_not_exists=True)
+    op.drop_index('ix_articles_feed', table_name='articles', if_exists=True)
@@ -0,0 +1,70 @@
+"""Convert articles.category_labels from JSON text to JSONB
+
+Revision ID: 010_category_labels_jsonb
+Revises: 009_add_article_feed_index
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010_category_labels_jsonb'
+down_revision = '009_add_article_feed_index'
+branch_labels = None
+depends_on = None
+
+
+def _normalize_labels(raw):
+    """Parse a legacy category_labels value into a JSON list string (or None if empty)"""
+    if not raw or not raw.strip():
+        return None
+    try:
+        labels = json.loads(raw)
+    except ValueError:
+        labels = raw.split(',')
+    if not isinstance(labels, list):
+        labels = [labels]
+    labels = [str(label).strip() for label in labels if label is not None and str(label).strip()]
+    return json.dumps(labels) if labels else None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        # Other backends keep storing JSON as text
+        return
+
+    # Only convert if the column is still plain text
+    result = conn.execute(sa.text("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'articles' AND column_name = 'category_labels'
+    """))
+    row = result.fetchone()
+
+    if row and row[0] == 'text':
+        # Rewrite anything that isn't a clean JSON list so the cast below can't fail
+        rows = conn.execute(sa.text(
+            "SELECT id, category_labels FROM articles WHERE category_labels IS NOT NULL"
+        )).fetchall()
+        for article_id, raw in rows:
+            normalized = _normalize_labels(raw)
+            if normalized != raw:
+                conn.execute(
+                    sa.text("UPDATE articles SET category_labels = :labels WHERE id = :id"),
+                    {"labels": normalized, "id": article_id},
+                )
+
+        op.execute(
+            "ALTER TABLE articles ALTER COLUMN category_labels TYPE JSONB USING category_labels::jsonb"
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE articles ALTER COLUMN category_labels TYPE TEXT USING category_labels::text")
@@ -0,0 +1,49 @@
+"""Add indexes for the category feed and per-author dashboard lists
+
+Revision ID: 011_article_author_category_idx
+Revises: 010_category_labels_jsonb
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_article_author_category_idx'
+down_revision = '010_category_labels_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Non-admin dashboard lists filter on author_id and sort newest first
+    op.create_index(
+        'ix_articles_author_created', 'articles',
+        ['author_id', sa.text('created_at DESC')], if_not_exists=True
+    )
+
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    # /articles?category=... runs the feed ordering within one category, so
+    # lead with category and follow the ix_articles_feed column order
+    op.create_index(
+        'ix_articles_category_feed', 'articles',
+        [
+            'category',
+            sa.text('pinned_at DESC NULLS LAST'),
+            sa.text('priority DESC'),
+            sa.text('is_breaking DESC'),
+            sa.text('created_at DESC'),
+        ],
+        postgresql_where=sa.text('is_published'), if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        op.drop_index('ix_articles_category_feed', table_name='articles', if_exists=True)
+
+    op.drop_index('ix_articles_author_created', table_name='articles', if_exists=True)
@@ -0,0 +1,57 @@
+"""Replace boolean-led article indexes with partial indexes
+
+Revision ID: 012_partial_article_indexes
+Revises: 011_article_author_category_idx
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012_partial_article_indexes'
+down_revision = '011_article_author_category_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        # Partial indexes are PostgreSQL-only here
+        return
+
+    # Sitemaps list published articles newest first; keep only those rows
+    # instead of leading a full index with a two-valued column
+    op.create_index(
+        'ix_articles_published_recent', 'articles', [sa.text('created_at DESC')],
+        postgresql_where=sa.text('is_published'), if_not_exists=True,
+    )
+
+    # Breaking articles are a handful of rows; index them by recency rather
+    # than by the (constant) is_breaking value itself
+    op.create_index(
+        'ix_articles_breaking_recent', 'articles', [sa.text('created_at DESC')],
+        postgresql_where=sa.text('is_breaking'), if_not_exists=True,
+    )
+
+    # Superseded by the partial indexes above
+    op.drop_index('ix_articles_published_created', table_name='articles', if_exists=True)
+    op.drop_index('ix_articles_breaking', table_name='articles', if_exists=True)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.create_index(
+        'ix_articles_breaking', 'articles', ['is_breaking'],
+        postgresql_where=sa.text('is_breaking IS TRUE'), if_not_exists=True
+    )
+    op.create_index(
+        'ix_articles_published_created', 'articles',
+        ['is_published', sa.text('created_at DESC')], if_not_exists=True
+    )
+    op.drop_index('ix_articles_breaking_recent', table_name='articles', if_exists=True)
+    op.drop_index('ix_articles_published_recent', table_name='articles', if_exists=True)
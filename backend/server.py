@@ -1,6 +1,6 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Request, Form, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
@@ -19,19 +19,25 @@ import bleach
 from PIL import Image
 import io
 import json
+import hashlib
+import time
 import traceback
+import threading
 import cloudinary
 import cloudinary.uploader
+from fastapi.concurrency import run_in_threadpool
 import cloudinary.api
 
 # Database imports
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import text, update, delete
 from database import (
     get_db, init_database, DBArticle, DBContact, DBUser, DBSettings, DBTrendingOpinion,
     DBOpinionUser, DBOpinionVote, DBOpinionComment, DBCommentVote,
-    ArticleCategory, UserRole, hash_password, verify_password, generate_slug,
-    log_error, ERROR_LOG_BUFFER, coerce_category
+    ArticleCategory, UserRole, hash_password, verify_password, verify_and_update_password, generate_slug,
+    seed_admin_hash, seed_backup_hash, seed_password_hash, dummy_verify_password,
+    log_error, ERROR_LOG_BUFFER, coerce_category,
+    add_article_with_unique_slug, ARTICLE_FEED_ORDER, warm_pool
 )
 
 ROOT_DIR = Path(__file__).parent
@@ -44,16 +50,22 @@ cloudinary.config(
     api_secret=os.getenv('CLOUDINARY_API_SECRET', '')
 )
 
-# Logging
-logging.basicConfig(level=logging.DEBUG)
+# Logging: INFO by default, LOG_LEVEL=DEBUG for the verbose auth diagnostics
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper())
+# The format never prints thread or process details, so don't look them up
+# for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
 # FastAPI app
-app = FastAPI(title="Crewkerne Gazette API", version="2.0.0")
+app = FastAPI(title="Crewkerne Gazette API", version="2.0.0", default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # JWT config with secure default fallback
 JWT_SECRET = os.getenv('JWT_SECRET') or 'emergency-fallback-secret-key-please-change'
+JWT_SECRET_BYTES = JWT_SECRET.encode('utf-8')  # encoded once, not on every sign/verify
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION_HOURS = 24
 
@@ -253,6 +265,24 @@ AVAILABLE_CATEGORY_LABELS = [
 # Security
 security = HTTPBearer(auto_error=False)
 
+# HTML sanitizing. bleach.clean() builds a new Cleaner (html5lib parser and
+# filter chain) on every call, so each thread keeps one Cleaner per profile
+# and reuses it; Cleaners hold parser state and aren't safe to share.
+ARTICLE_CONTENT_TAGS = bleach.ALLOWED_TAGS | {'p', 'br', 'strong', 'em', 'u', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li'}
+BLEACH_PROFILES = {
+    'article': {'tags': ARTICLE_CONTENT_TAGS, 'strip': True},
+    'text': {'strip': True},  # bleach's default tags, e.g. leaderboard names
+}
+_bleach_cleaners = threading.local()
+
+def sanitize_html(value: str, profile: str = 'article') -> str:
+    """Clean HTML with this thread's cached bleach Cleaner for the given profile"""
+    cleaner = getattr(_bleach_cleaners, profile, None)
+    if cleaner is None:
+        cleaner = bleach.sanitizer.Cleaner(**BLEACH_PROFILES[profile])
+        setattr(_bleach_cleaners, profile, cleaner)
+    return cleaner.clean(value)
+
 # Pydantic Models (API Models)
 class User(BaseModel):
     id: Optional[int] = None
@@ -308,6 +338,36 @@ class Article(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+def article_from_db(db_article: DBArticle) -> Article:
+    """Build an Article response from a database row without re-validating it.
+
+    Rows were validated on the way in, so list endpoints use model_construct
+    to skip the per-field coercion pass over every article.
+    """
+    return Article.model_construct(
+        id=db_article.id,
+        uuid=db_article.uuid,
+        slug=db_article.slug,
+        title=db_article.title,
+        subheading=db_article.subheading,
+        content=db_article.content,
+        category=ArticleCategory(db_article.category),
+        publisher_name=db_article.publisher_name,
+        author_name=db_article.author_name,
+        author_id=db_article.author_id,
+        featured_image=db_article.featured_image,
+        image_caption=db_article.image_caption,
+        video_url=db_article.video_url,
+        tags=db_article.tags or [],
+        category_labels=db_article.category_labels or [],
+        is_breaking=db_article.is_breaking,
+        is_published=db_article.is_published,
+        pinned_at=db_article.pinned_at,
+        priority=db_article.priority,
+        created_at=db_article.created_at,
+        updated_at=db_article.updated_at
+    )
+
 class ArticleCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
     subheading: Optional[str] = Field(None, max_length=500)
@@ -329,8 +389,7 @@ class ArticleCreate(BaseModel):
     @validator('content', pre=True)
     def sanitize_content(cls, v):
         if v:
-            allowed_tags = list(bleach.ALLOWED_TAGS) + ['p', 'br', 'strong', 'em', 'u', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li']
-            return bleach.clean(v, tags=allowed_tags, strip=True)
+            return sanitize_html(v)
         return v
 
 class Contact(BaseModel):
@@ -377,8 +436,8 @@ async def submit_score(entry: LeaderboardEntry, db: Session = Depends(get_db)):
     """Submit a score to the Dover Dash leaderboard"""
     try:
         # Sanitize player name
-        clean_name = bleach.clean(entry.player_name, strip=True)
-        clean_title = bleach.clean(entry.title, strip=True)
+        clean_name = sanitize_html(entry.player_name, 'text')
+        clean_title = sanitize_html(entry.title, 'text')
         
         # Create leaderboard table if it doesn't exist
         db.execute(text("""
@@ -538,15 +597,33 @@ def create_jwt_token(user_data: dict) -> str:
     """Create JWT token"""
     expiry = datetime.utcnow() + timedelta(hours=JWT_EXPIRATION_HOURS)
     token_data = {**user_data, 'exp': expiry}
-    return jwt.encode(token_data, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return jwt.encode(token_data, JWT_SECRET_BYTES, algorithm=JWT_ALGORITHM)
 
 def decode_jwt_token(token: str) -> dict:
     """Decode JWT token"""
     try:
-        return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        return jwt.decode(token, JWT_SECRET_BYTES, algorithms=[JWT_ALGORITHM])
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Short-lived cache of authenticated users, keyed by a digest of the raw token,
+# so clients polling the dashboard with the same token skip both the HMAC
+# verify and the users lookup. The TTL is kept short so disabling an account
+# or changing a role takes effect within seconds, and entries never outlive
+# the token's exp. Failed authentications are never cached.
+AUTH_CACHE_TTL_SECONDS = 5
+AUTH_CACHE_MAX_ENTRIES = 10_000
+_auth_user_cache = {}
+
+def _cache_authenticated_user(key: bytes, user: User, token_data: dict, now: float) -> User:
+    expires_at = min(now + AUTH_CACHE_TTL_SECONDS, token_data.get('exp', now))
+    if expires_at > now:
+        if len(_auth_user_cache) >= AUTH_CACHE_MAX_ENTRIES:
+            # Drop the oldest entry (dicts keep insertion order)
+            _auth_user_cache.pop(next(iter(_auth_user_cache)), None)
+        _auth_user_cache[key] = (user, expires_at)
+    return user
+
 async def get_current_user(
     request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
@@ -569,6 +646,12 @@ async def get_current_user(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
+    cache_key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+    now = time.time()
+    cached = _auth_user_cache.get(cache_key)
+    if cached and cached[1] > now:
+        return cached[0]
+
     # Continue with existing token validation logic
     try:
         token_data = decode_jwt_token(token)
@@ -586,7 +669,7 @@ async def get_current_user(
             try:
                 db_user = db.query(DBUser).filter(DBUser.username == username).first()
                 if db_user:
-                    logger.debug(f"🔐 User validation: Database user found for {username}")
+                    logger.debug("🔐 User validation: Database user found for %s", username)
                     user_obj = User(
                         id=db_user.id,
                         username=db_user.username,
@@ -596,7 +679,7 @@ async def get_current_user(
                         created_at=db_user.created_at
                     )
                     db.close()
-                    return user_obj
+                    return _cache_authenticated_user(cache_key, user_obj, token_data, now)
             finally:
                 db.close()
         except Exception as db_error:
@@ -612,7 +695,7 @@ async def get_current_user(
         if username in emergency_users and user_id == "emergency":
             logger.info(f"🆘 Emergency user validation for {username}")
             emergency_user = emergency_users[username]
-            return User(
+            user_obj = User(
                 id=emergency_user["id"],
                 username=username,
                 email=f"{username}@emergency.local",
@@ -620,6 +703,7 @@ async def get_current_user(
                 is_active=True,
                 created_at=datetime.now(timezone.utc)
             )
+            return _cache_authenticated_user(cache_key, user_obj, token_data, now)
         
         # If we get here, user not found in database or emergency system
         logger.warning(f"❌ User {username} not found in database or emergency system")
@@ -632,13 +716,27 @@ async def get_current_user(
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 # Helper functions for database operations
+
+# Process-local snapshot of the whole settings table, refreshed at most every
+# SETTINGS_CACHE_TTL_SECONDS. Settings are read on every public page load but
+# change rarely; the TTL bounds how stale other workers can be, and
+# set_setting() drops this worker's copy immediately.
+SETTINGS_CACHE_TTL_SECONDS = 30
+_settings_cache = None  # (values dict, expires_at)
+
 def get_setting(db: Session, key: str, default: str = "") -> str:
     """Get setting value from database"""
-    setting = db.query(DBSettings).filter(DBSettings.key == key).first()
-    return setting.value if setting else default
+    global _settings_cache
+    now = time.time()
+    if _settings_cache is None or _settings_cache[1] <= now:
+        values = dict(db.query(DBSettings.key, DBSettings.value).all())
+        _settings_cache = (values, now + SETTINGS_CACHE_TTL_SECONDS)
+    values = _settings_cache[0]
+    return values[key] if key in values else default
 
 def set_setting(db: Session, key: str, value: str):
     """Set setting value in database"""
+    global _settings_cache
     setting = db.query(DBSettings).filter(DBSettings.key == key).first()
     if setting:
         setting.value = value
@@ -647,6 +745,50 @@ def set_setting(db: Session, key: str, value: str):
         setting = DBSettings(key=key, value=value)
         db.add(setting)
     db.commit()
+    _settings_cache = None
+
+MAX_IMAGE_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Leading bytes of the image formats we accept, checked instead of trusting the
+# client's Content-Type header
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+)
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """Return the image format named by a file's first bytes, or None"""
+    for signature, image_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return image_type
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    if head[4:8] == b'ftyp' and head[8:12] in (b'avif', b'heic', b'heix', b'mif1'):
+        return 'avif' if head[8:12] == b'avif' else 'heic'
+    return None
+
+async def upload_image_to_cloudinary(upload: UploadFile, **options) -> dict:
+    """Upload an image to Cloudinary without blocking the event loop
+
+    The Cloudinary SDK does blocking HTTP, so it runs in the threadpool, and it
+    is handed the spooled upload file itself rather than a bytes copy of it.
+    Oversized files and files that aren't really images are rejected before
+    anything is sent.
+    """
+    size = upload.size
+    if size is None:
+        size = await run_in_threadpool(upload.file.seek, 0, os.SEEK_END)
+    if size > MAX_IMAGE_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Image must be {MAX_IMAGE_UPLOAD_BYTES // (1024 * 1024)}MB or smaller")
+    
+    await upload.seek(0)
+    if sniff_image_type(await upload.read(16)) is None:
+        raise HTTPException(status_code=400, detail="File must be a JPEG, PNG, GIF, WebP or AVIF/HEIC image")
+    
+    await upload.seek(0)
+    return await run_in_threadpool(cloudinary.uploader.upload, upload.file, **options)
 
 # Trending Opinions API Endpoints
 @api_router.post("/opinions")
@@ -661,12 +803,9 @@ async def upload_trending_opinion(
         if not file.content_type.startswith('image/'):
             raise HTTPException(status_code=400, detail="File must be an image")
         
-        # Read file content
-        contents = await file.read()
-        
         # Upload to Cloudinary
-        upload_result = cloudinary.uploader.upload(
-            contents,
+        upload_result = await upload_image_to_cloudinary(
+            file,
             folder="crewkerne-gazette/trending-opinions",
             resource_type="image",
             transformation=[
@@ -686,7 +825,6 @@ async def upload_trending_opinion(
             )
             db.add(new_opinion)
             db.commit()
-            db.refresh(new_opinion)
         except Exception as insert_error:
             db.rollback()
             # Fallback: Try inserting without upvotes/downvotes columns
@@ -947,7 +1085,6 @@ async def register_opinion_user(
         )
         db.add(new_user)
         db.commit()
-        db.refresh(new_user)
         
         logger.info(f"👤 New opinion user registered: {username}")
         
@@ -1125,7 +1262,7 @@ async def add_comment(
             raise HTTPException(status_code=401, detail="Please register to comment")
         
         # Verify opinion exists
-        opinion = db.query(DBTrendingOpinion).filter(DBTrendingOpinion.id == opinion_id).first()
+        opinion = db.query(DBTrendingOpinion.id).filter(DBTrendingOpinion.id == opinion_id).first()
         if not opinion:
             raise HTTPException(status_code=404, detail="Opinion not found")
         
@@ -1138,7 +1275,6 @@ async def add_comment(
         )
         db.add(new_comment)
         db.commit()
-        db.refresh(new_comment)
         
         logger.info(f"💬 New comment on opinion {opinion_id} by {user.username}")
         
@@ -1505,29 +1641,29 @@ async def create_sample_article(db: Session = Depends(get_db)):
             }
         
         # Create sample article
+        now = datetime.now(timezone.utc)
         sample_article = DBArticle(
             uuid=str(uuid.uuid4()),
             slug="sample-facebook-test-article",
             title="Facebook Sharing Test Article",
             subheading="This article tests Facebook Open Graph sharing functionality",
             content="<p>This is a sample article created to test Facebook sharing and Open Graph meta tags. The article contains rich content that should display properly when shared on social media platforms.</p><p>The featured image should appear as a large preview, and the title and description should be correctly formatted for social media sharing.</p>",
-            category=ArticleCategory.NEWS,
+            category=ArticleCategory.NEWS.value,
             publisher_name="The Crewkerne Gazette",
             author_name="Test Author",
             author_id="test-author-123",
             featured_image="https://res.cloudinary.com/demo/image/upload/w_1200,h_630,c_fill,f_jpg,q_auto/sample.jpg",
             image_caption="Sample image for Facebook sharing test",
-            tags='["facebook", "sharing", "test", "og-tags"]',
-            category_labels='["News", "Tech"]',
+            tags=["facebook", "sharing", "test", "og-tags"],
+            category_labels=["News", "Tech"],
             is_breaking=False,
             is_published=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            created_at=now,
+            updated_at=now
         )
         
         db.add(sample_article)
         db.commit()
-        db.refresh(sample_article)
         
         return {
             "message": "Sample article created successfully",
@@ -1563,8 +1699,7 @@ async def serve_article_page(article_slug: str, request: Request, db: Session =
             logger.info(f"🔍 Crawler lookup: original='{original_slug}' normalized='{normalized_slug}'")
             
             # Get recent slugs for comparison (increased to 20 for better debugging)
-            recent_articles = db.query(DBArticle).order_by(DBArticle.created_at.desc()).limit(20).all()
-            recent_slugs = [art.slug for art in recent_articles]
+            recent_slugs = [slug for (slug,) in db.query(DBArticle.slug).order_by(DBArticle.created_at.desc()).limit(20)]
             logger.info(f"📊 Last 20 slugs in DB: {recent_slugs}")
             
             # Case-insensitive slug lookup
@@ -1575,7 +1710,7 @@ async def serve_article_page(article_slug: str, request: Request, db: Session =
                 logger.warning(f"📄 Article not found for slug: original='{original_slug}' normalized='{normalized_slug}'")
                 
                 # Find closest matching slug using Levenshtein distance
-                all_slugs = [art.slug for art in db.query(DBArticle).all()]
+                all_slugs = [slug for (slug,) in db.query(DBArticle.slug)]
                 closest_matches = []
                 for slug in all_slugs:
                     distance = calculate_levenshtein_distance(normalized_slug, slug.lower())
@@ -1661,8 +1796,8 @@ async def serve_article_page(article_slug: str, request: Request, db: Session =
                 featured_image=db_article.featured_image,
                 image_caption=db_article.image_caption,
                 video_url=db_article.video_url,
-                tags=json.loads(db_article.tags) if db_article.tags else [],
-                category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
+                tags=db_article.tags or [],
+                category_labels=db_article.category_labels or [],
                 is_breaking=db_article.is_breaking,
                 is_published=db_article.is_published,
                 pinned_at=db_article.pinned_at,
@@ -1943,6 +2078,7 @@ async def login(user_data: LoginRequest, response: Response, db: Session = Depen
     logger.info(f"🔐 Login attempt for user: {user_data.username}")
     
     # Enhanced logging for debugging
+    db_user = None
     try:
         # First try database authentication
         logger.debug("🗄️ Querying database for user...")
@@ -1956,24 +2092,32 @@ async def login(user_data: LoginRequest, response: Response, db: Session = Depen
                 raise HTTPException(status_code=400, detail="Account disabled")
             
             # Verify password with enhanced logging
-            logger.debug(f"🔐 Verifying password against database hash (hash length: {len(db_user.password_hash)})")
-            password_valid = verify_password(user_data.password, db_user.password_hash)
+            logger.debug("🔐 Verifying password against database hash (hash length: %d)", len(db_user.password_hash))
+            password_valid, upgraded_hash = await run_in_threadpool(
+                verify_and_update_password, user_data.password, db_user.password_hash
+            )
             logger.info(f"🔐 Password verify result: {'✅ SUCCESS' if password_valid else '❌ FAILED'}")
             
+            if password_valid and upgraded_hash:
+                # Legacy bcrypt hash: store the Argon2id replacement so later logins verify faster
+                db_user.password_hash = upgraded_hash
+                db.commit()
+                logger.info("🔐 Password hash upgraded to Argon2id")
+            
             if password_valid:
                 logger.info("✅ Database authentication successful")
                 
                 # Create token
                 token_data = {
                     "username": db_user.username,
-                    "role": db_user.role.value,
+                    "role": db_user.role,
                     "user_id": db_user.id
                 }
                 
                 # Test JWT creation doesn't fail
                 try:
                     access_token = create_jwt_token(token_data)
-                    logger.debug(f"🎫 JWT token created successfully (length: {len(access_token)})")
+                    logger.debug("🎫 JWT token created successfully (length: %d)", len(access_token))
                 except Exception as jwt_error:
                     logger.error(f"❌ JWT token creation failed: {jwt_error}")
                     raise HTTPException(status_code=500, detail="Token creation failed")
@@ -1984,7 +2128,7 @@ async def login(user_data: LoginRequest, response: Response, db: Session = Depen
                 return {
                     "access_token": access_token,
                     "token_type": "bearer",
-                    "role": db_user.role.value,
+                    "role": db_user.role,
                     "message": "Database login successful"
                 }
             else:
@@ -1996,22 +2140,21 @@ async def login(user_data: LoginRequest, response: Response, db: Session = Depen
         raise
     except Exception as e:
         logger.error(f"⚠️ Database authentication error: {e}")
-        import traceback
-        logger.debug(f"🔍 Database error traceback: {traceback.format_exc()}")
+        logger.debug("🔍 Database error traceback", exc_info=True)
     
     # Fallback to emergency login system
     logger.info("🆘 Attempting emergency authentication fallback...")
     emergency_users = {
-        "admin": {"password_hash": hash_password("admin123"), "role": UserRole.ADMIN},
-        "admin_backup": {"password_hash": hash_password("admin_backup"), "role": UserRole.ADMIN},
-        "Gazette": {"password_hash": hash_password("Gazette2024!"), "role": UserRole.ADMIN}
+        "admin": {"password_hash": seed_admin_hash(), "role": UserRole.ADMIN},
+        "admin_backup": {"password_hash": seed_backup_hash(), "role": UserRole.ADMIN},
+        "Gazette": {"password_hash": seed_password_hash("Gazette2024!"), "role": UserRole.ADMIN}
     }
     
     if user_data.username in emergency_users:
-        logger.debug(f"🆘 Found emergency user: {user_data.username}")
+        logger.debug("🆘 Found emergency user: %s", user_data.username)
         emergency_user = emergency_users[user_data.username]
         
-        if verify_password(user_data.password, emergency_user['password_hash']):
+        if await run_in_threadpool(verify_password, user_data.password, emergency_user['password_hash']):
             logger.info(f"✅ Fallback auth for {user_data.username} - Emergency authentication successful")
             
             try:
@@ -2020,7 +2163,7 @@ async def login(user_data: LoginRequest, response: Response, db: Session = Depen
                     "role": emergency_user['role'].value,
                     "user_id": "emergency"
                 })
-                logger.debug(f"🎫 Emergency JWT token created (length: {len(access_token)})")
+                logger.debug("🎫 Emergency JWT token created (length: %d)", len(access_token))
             except Exception as jwt_error:
                 logger.error(f"❌ Emergency JWT token creation failed: {jwt_error}")
                 raise HTTPException(status_code=500, detail="Emergency token creation failed")
@@ -2037,7 +2180,11 @@ async def login(user_data: LoginRequest, response: Response, db: Session = Depen
         else:
             logger.warning("❌ Emergency password verification failed")
     else:
-        logger.debug(f"🆘 User '{user_data.username}' not in emergency users")
+        logger.debug("🆘 User '%s' not in emergency users", user_data.username)
+        if db_user is None:
+            # No hash was checked at all: spend one verify so unknown usernames
+            # fail as slowly as wrong passwords and can't be enumerated by timing
+            await run_in_threadpool(dummy_verify_password)
     
     logger.error("❌ Authentication failed - all methods exhausted")
     raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -2050,11 +2197,11 @@ async def change_password(password_data: PasswordChangeRequest, current_user: Us
         raise HTTPException(status_code=404, detail="User not found")
     
     # Verify current password
-    if not verify_password(password_data.current_password, db_user.password_hash):
+    if not await run_in_threadpool(verify_password, password_data.current_password, db_user.password_hash):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
     
     # Update password
-    db_user.password_hash = hash_password(password_data.new_password)
+    db_user.password_hash = await run_in_threadpool(hash_password, password_data.new_password)
     db_user.updated_at = datetime.now(timezone.utc)
     db.commit()
     
@@ -2069,12 +2216,9 @@ async def upload_image(file: UploadFile = File(...), current_user: User = Depend
         if not file.content_type.startswith('image/'):
             raise HTTPException(status_code=400, detail="File must be an image")
         
-        # Read file content
-        contents = await file.read()
-        
         # Upload to Cloudinary
-        upload_result = cloudinary.uploader.upload(
-            contents,
+        upload_result = await upload_image_to_cloudinary(
+            file,
             folder="crewkerne-gazette",
             resource_type="image",
             transformation=[
@@ -2093,6 +2237,8 @@ async def upload_image(file: UploadFile = File(...), current_user: User = Depend
             "bytes": upload_result.get('bytes')
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Image upload error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Image upload failed: {str(e)}")
@@ -2110,40 +2256,9 @@ async def get_top_rail(db: Session = Depends(get_db)):
         # Get articles with the same ordering logic as main listing
         query = db.query(DBArticle).filter(DBArticle.is_published == True)
         
-        db_articles = query.order_by(
-            (DBArticle.pinned_at.isnot(None)).desc(),
-            DBArticle.pinned_at.desc(),
-            DBArticle.priority.desc(),
-            DBArticle.is_breaking.desc(),
-            DBArticle.created_at.desc()
-        ).limit(15).all()
-        
-        articles = []
-        for db_article in db_articles:
-            article = Article(
-                id=db_article.id,
-                uuid=db_article.uuid,
-                slug=db_article.slug,
-                title=db_article.title,
-                subheading=db_article.subheading,
-                content=db_article.content,
-                category=db_article.category,
-                publisher_name=db_article.publisher_name,
-                author_name=db_article.author_name,
-                author_id=db_article.author_id,
-                featured_image=db_article.featured_image,
-                image_caption=db_article.image_caption,
-                video_url=db_article.video_url,
-                tags=json.loads(db_article.tags) if db_article.tags else [],
-                category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
-                is_breaking=db_article.is_breaking,
-                is_published=db_article.is_published,
-                pinned_at=db_article.pinned_at,
-                priority=db_article.priority,
-                created_at=db_article.created_at,
-                updated_at=db_article.updated_at
-            )
-            articles.append(article)
+        db_articles = query.order_by(*ARTICLE_FEED_ORDER).limit(15).all()
+        
+        articles = [article_from_db(db_article) for db_article in db_articles]
         
         # Format for top rail layout
         return {
@@ -2169,45 +2284,40 @@ async def get_articles(limit: int = 10, category: Optional[str] = None, db: Sess
     if category:
         query = query.filter(DBArticle.category == category)
     
-    # Order by pinning logic: pinned first, then by priority, breaking, then newest
-    db_articles = query.order_by(
-        (DBArticle.pinned_at.isnot(None)).desc(),  # Pinned articles first
-        DBArticle.pinned_at.desc(),                # Newest pin wins among pinned
-        DBArticle.priority.desc(),                 # Higher priority first
-        DBArticle.is_breaking.desc(),              # Breaking news next
-        DBArticle.created_at.desc()                # Then by newest
-    ).limit(limit).all()
+    # Order by pinning logic: pinned first (newest pin wins), then by priority,
+    # breaking, then newest - matches the ix_articles_feed index
+    db_articles = query.order_by(*ARTICLE_FEED_ORDER).limit(limit).all()
     
     # Convert to Pydantic models
-    articles = []
-    for db_article in db_articles:
-        article = Article(
-            id=db_article.id,
-            uuid=db_article.uuid,
-            slug=db_article.slug,
-            title=db_article.title,
-            subheading=db_article.subheading,
-            content=db_article.content,
-            category=db_article.category,
-            publisher_name=db_article.publisher_name,
-            author_name=db_article.author_name,
-            author_id=db_article.author_id,
-            featured_image=db_article.featured_image,
-            image_caption=db_article.image_caption,
-            video_url=db_article.video_url,
-            tags=json.loads(db_article.tags) if db_article.tags else [],
-            category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
-            is_breaking=db_article.is_breaking,
-            is_published=db_article.is_published,
-            pinned_at=db_article.pinned_at,
-            priority=db_article.priority,
-            created_at=db_article.created_at,
-            updated_at=db_article.updated_at
-        )
-        articles.append(article)
+    articles = [article_from_db(db_article) for db_article in db_articles]
     
     return articles
 
+ARTICLE_STREAM_BATCH_SIZE = 100
+
+@api_router.get("/articles/stream")
+async def stream_articles(limit: int = 500, category: Optional[str] = None):
+    """Stream published articles as NDJSON, one article per line"""
+    def generate():
+        # The request's get_db session is closed before a streamed body is sent,
+        # so the generator owns its session for as long as rows are read
+        from database import SessionLocal
+        db = SessionLocal()
+        try:
+            query = db.query(DBArticle).filter(DBArticle.is_published == True)
+            if category:
+                query = query.filter(DBArticle.category == category)
+            
+            # yield_per reads through a server-side cursor in batches, so the
+            # first line goes out before the last row has been fetched
+            rows = query.order_by(*ARTICLE_FEED_ORDER).limit(limit).yield_per(ARTICLE_STREAM_BATCH_SIZE)
+            for db_article in rows:
+                yield article_from_db(db_article).model_dump_json() + "\n"
+        finally:
+            db.close()
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @api_router.get("/articles/{article_slug}", response_model=Article)
 async def get_article(article_slug: str, db: Session = Depends(get_db)):
     """Get article by slug"""
@@ -2229,8 +2339,8 @@ async def get_article(article_slug: str, db: Session = Depends(get_db)):
         featured_image=db_article.featured_image,
         image_caption=db_article.image_caption,
         video_url=db_article.video_url,
-        tags=json.loads(db_article.tags) if db_article.tags else [],
-        category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
+        tags=db_article.tags or [],
+        category_labels=db_article.category_labels or [],
         is_breaking=db_article.is_breaking,
         is_published=db_article.is_published,
         pinned_at=db_article.pinned_at,
@@ -2265,12 +2375,9 @@ async def create_article(
     featured_image_url = None
     if featured_image and featured_image.content_type.startswith('image/'):
         try:
-            # Read file content
-            contents = await featured_image.read()
-            
             # Upload to Cloudinary
-            upload_result = cloudinary.uploader.upload(
-                contents,
+            upload_result = await upload_image_to_cloudinary(
+                featured_image,
                 folder="crewkerne-gazette/articles",
                 resource_type="image",
                 transformation=[
@@ -2283,6 +2390,10 @@ async def create_article(
             featured_image_url = upload_result['secure_url']
             logger.info(f"Image uploaded to Cloudinary: {featured_image_url}")
             
+        except HTTPException:
+            # Oversized or non-image uploads are the client's error; don't
+            # create the article without its image
+            raise
         except Exception as e:
             logger.error(f"Image upload error: {str(e)}")
             # Continue without image rather than failing
@@ -2309,15 +2420,11 @@ async def create_article(
     category_enum = coerce_category(category)
     
     # Sanitize content
-    cleaned_content = bleach.clean(
-        content, 
-        tags=list(bleach.ALLOWED_TAGS) + ['p', 'br', 'strong', 'em', 'u', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li'],
-        strip=True
-    )
+    cleaned_content = sanitize_html(content)
     
     # Generate UUID and slug for the article
     article_uuid = str(uuid.uuid4())
-    article_slug = generate_slug(title, db)
+    article_slug = generate_slug(title)
     
     # Handle pinning with timezone-aware datetime
     pinned_at = datetime.now(timezone.utc) if pin else None
@@ -2329,24 +2436,22 @@ async def create_article(
         title=title,
         subheading=subheading,
         content=cleaned_content,
-        category=category_enum,
+        category=category_enum.value,
         publisher_name=publisher_name,
         author_name=current_user.username,
         author_id=str(current_user.id),
         featured_image=featured_image_url,
         image_caption=image_caption,
         video_url=video_url,
-        tags=json.dumps(tags_list),
-        category_labels=json.dumps(valid_category_labels),
+        tags=tags_list,
+        category_labels=valid_category_labels,
         is_breaking=is_breaking,
         is_published=is_published,
         pinned_at=pinned_at,
         priority=priority
     )
     
-    db.add(db_article)
-    db.commit()
-    db.refresh(db_article)
+    add_article_with_unique_slug(db, db_article)
     
     return Article(
         id=db_article.id,
@@ -2362,8 +2467,8 @@ async def create_article(
         featured_image=db_article.featured_image,
         image_caption=db_article.image_caption,
         video_url=db_article.video_url,
-        tags=json.loads(db_article.tags) if db_article.tags else [],
-        category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
+        tags=db_article.tags or [],
+        category_labels=db_article.category_labels or [],
         is_breaking=db_article.is_breaking,
         is_published=db_article.is_published,
         pinned_at=db_article.pinned_at,
@@ -2397,7 +2502,7 @@ async def create_article_json(
         
         # Generate ids/slug
         article_uuid = str(uuid.uuid4())
-        article_slug = generate_slug(payload.title, db)
+        article_slug = generate_slug(payload.title)
         logging.info(f"ARTICLES_JSON generated: uuid={article_uuid}, slug='{article_slug}'")
 
         # Filter category labels to only include valid ones
@@ -2416,15 +2521,15 @@ async def create_article_json(
             title=payload.title,
             subheading=payload.subheading,
             content=payload.content,
-            category=category_enum,
+            category=category_enum.value,
             publisher_name=payload.publisher_name or "The Crewkerne Gazette",
             author_name=current_user.username,
             author_id=str(current_user.id),
             featured_image=payload.featured_image,
             image_caption=payload.image_caption,
             video_url=payload.video_url,
-            tags=json.dumps(payload.tags or []),
-            category_labels=json.dumps(valid_category_labels),
+            tags=payload.tags or [],
+            category_labels=valid_category_labels,
             is_breaking=payload.is_breaking,
             is_published=payload.is_published,
             pinned_at=pinned_at,
@@ -2432,16 +2537,13 @@ async def create_article_json(
         )
 
         logging.info("ARTICLES_JSON adding to database")
-        db.add(db_article)
-        db.flush()  # Flush to get the ID before commit
-        db.commit()
-        db.refresh(db_article)
+        add_article_with_unique_slug(db, db_article)
         
         # Simple database verification
         logging.info(f"ARTICLES_JSON: Verifying article {db_article.id} with slug '{db_article.slug}'")
         
         # Basic verification in same session
-        verification = db.query(DBArticle).filter(DBArticle.id == db_article.id).first()
+        verification = db.query(DBArticle.id).filter(DBArticle.id == db_article.id).first()
         if not verification:
             logging.error(f"ARTICLES_JSON ERROR: Article not found after commit! ID: {db_article.id}")
             raise HTTPException(status_code=500, detail={
@@ -2467,8 +2569,8 @@ async def create_article_json(
             featured_image=db_article.featured_image,
             image_caption=db_article.image_caption,
             video_url=db_article.video_url,
-            tags=json.loads(db_article.tags) if db_article.tags else [],
-            category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
+            tags=db_article.tags or [],
+            category_labels=db_article.category_labels or [],
             is_breaking=db_article.is_breaking,
             is_published=db_article.is_published,
             pinned_at=db_article.pinned_at,
@@ -2492,33 +2594,48 @@ async def create_article_json(
             "details": {"message": str(e)}
         })
 
+def _article_owner_filter(current_user: User) -> list:
+    """WHERE conditions limiting article writes to ones the user may change"""
+    if current_user.role == UserRole.ADMIN:
+        return []
+    return [DBArticle.author_id == str(current_user.id)]
+
 @api_router.put("/articles/{article_uuid}", response_model=Article)
 async def update_article(article_uuid: str, article_data: ArticleCreate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Update existing article"""
-    db_article = db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
-    if not db_article:
+    try:
+        uuid.UUID(article_uuid)
+    except ValueError:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # Check permissions
-    if current_user.role != UserRole.ADMIN and db_article.author_id != str(current_user.id):
-        raise HTTPException(status_code=403, detail="You can only edit your own articles")
+    # One UPDATE ... RETURNING applies the edit, enforces ownership and hands
+    # back the new row; only a miss needs a second read to tell 404 from 403
+    db_article = db.execute(
+        update(DBArticle)
+        .where(DBArticle.uuid == article_uuid, *_article_owner_filter(current_user))
+        .values(
+            title=article_data.title,
+            subheading=article_data.subheading,
+            content=article_data.content,
+            category=coerce_category(article_data.category).value,
+            publisher_name=article_data.publisher_name,
+            featured_image=article_data.featured_image,
+            image_caption=article_data.image_caption,
+            video_url=article_data.video_url,
+            tags=article_data.tags,
+            is_breaking=article_data.is_breaking,
+            is_published=article_data.is_published,
+            updated_at=datetime.now(timezone.utc),
+        )
+        .returning(DBArticle)
+    ).scalar_one_or_none()
     
-    # Update fields
-    db_article.title = article_data.title
-    db_article.subheading = article_data.subheading
-    db_article.content = article_data.content
-    db_article.category = article_data.category
-    db_article.publisher_name = article_data.publisher_name
-    db_article.featured_image = article_data.featured_image
-    db_article.image_caption = article_data.image_caption
-    db_article.video_url = article_data.video_url
-    db_article.tags = json.dumps(article_data.tags)
-    db_article.is_breaking = article_data.is_breaking
-    db_article.is_published = article_data.is_published
-    db_article.updated_at = datetime.now(timezone.utc)
+    if db_article is None:
+        if not db.query(DBArticle.id).filter(DBArticle.uuid == article_uuid).first():
+            raise HTTPException(status_code=404, detail="Article not found")
+        raise HTTPException(status_code=403, detail="You can only edit your own articles")
     
     db.commit()
-    db.refresh(db_article)
     
     return Article(
         id=db_article.id,
@@ -2534,8 +2651,8 @@ async def update_article(article_uuid: str, article_data: ArticleCreate, current
         featured_image=db_article.featured_image,
         image_caption=db_article.image_caption,
         video_url=db_article.video_url,
-        tags=json.loads(db_article.tags) if db_article.tags else [],
-        category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
+        tags=db_article.tags or [],
+        category_labels=db_article.category_labels or [],
         is_breaking=db_article.is_breaking,
         is_published=db_article.is_published,
         pinned_at=db_article.pinned_at,
@@ -2547,15 +2664,21 @@ async def update_article(article_uuid: str, article_data: ArticleCreate, current
 @api_router.delete("/articles/{article_uuid}")
 async def delete_article(article_uuid: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Delete article"""
-    db_article = db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
-    if not db_article:
+    try:
+        uuid.UUID(article_uuid)
+    except ValueError:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # Check permissions
-    if current_user.role != UserRole.ADMIN and db_article.author_id != str(current_user.id):
+    deleted_id = db.execute(
+        delete(DBArticle)
+        .where(DBArticle.uuid == article_uuid, *_article_owner_filter(current_user))
+        .returning(DBArticle.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
+        if not db.query(DBArticle.id).filter(DBArticle.uuid == article_uuid).first():
+            raise HTTPException(status_code=404, detail="Article not found")
         raise HTTPException(status_code=403, detail="You can only delete your own articles")
     
-    db.delete(db_article)
     db.commit()
     
     return {"message": "Article deleted successfully", "deleted_article_uuid": article_uuid}
@@ -2563,17 +2686,17 @@ async def delete_article(article_uuid: str, current_user: User = Depends(get_cur
 @api_router.delete("/articles/id/{article_id}")
 async def delete_article_by_id(article_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Delete article by numeric ID"""
-    db_article = db.query(DBArticle).filter(DBArticle.id == article_id).first()
-    if not db_article:
-        raise HTTPException(status_code=404, detail={"error": "Article not found"})
-    
-    # Check permissions
-    if current_user.role != UserRole.ADMIN and db_article.author_id != str(current_user.id):
+    deleted = db.execute(
+        delete(DBArticle)
+        .where(DBArticle.id == article_id, *_article_owner_filter(current_user))
+        .returning(DBArticle.title, DBArticle.slug)
+    ).first()
+    if deleted is None:
+        if not db.query(DBArticle.id).filter(DBArticle.id == article_id).first():
+            raise HTTPException(status_code=404, detail={"error": "Article not found"})
         raise HTTPException(status_code=403, detail={"error": "You can only delete your own articles"})
     
-    article_title = db_article.title
-    article_slug = db_article.slug
-    db.delete(db_article)
+    article_title, article_slug = deleted
     db.commit()
     
     logger.info(f"🗑️ Article deleted by {current_user.username}: '{article_title}' (ID: {article_id}, slug: {article_slug})")
@@ -2583,16 +2706,16 @@ async def delete_article_by_id(article_id: int, current_user: User = Depends(get
 @api_router.delete("/articles/by-slug/{article_slug}")
 async def delete_article_by_slug(article_slug: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Delete article by slug"""
-    db_article = db.query(DBArticle).filter(DBArticle.slug == article_slug).first()
-    if not db_article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    
-    # Check permissions
-    if current_user.role != UserRole.ADMIN and db_article.author_id != str(current_user.id):
+    article_title = db.execute(
+        delete(DBArticle)
+        .where(DBArticle.slug == article_slug, *_article_owner_filter(current_user))
+        .returning(DBArticle.title)
+    ).scalar_one_or_none()
+    if article_title is None:
+        if not db.query(DBArticle.id).filter(DBArticle.slug == article_slug).first():
+            raise HTTPException(status_code=404, detail="Article not found")
         raise HTTPException(status_code=403, detail="You can only delete your own articles")
     
-    article_title = db_article.title
-    db.delete(db_article)
     db.commit()
     
     logger.info(f"🗑️ Article deleted by {current_user.username}: '{article_title}' (slug: {article_slug})")
@@ -2608,10 +2731,15 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
         from database import SessionLocal
         db = SessionLocal()
         try:
-            total_articles = db.query(DBArticle).count()
-            published_articles = db.query(DBArticle).filter(DBArticle.is_published == True).count()
-            breaking_news = db.query(DBArticle).filter(DBArticle.is_breaking == True).count()
-            total_contacts = db.query(DBContact).count()
+            # All four counts in one round-trip (aggregate FILTER clauses plus a
+            # scalar subquery for contacts) instead of four sequential COUNTs
+            from sqlalchemy import func
+            total_articles, published_articles, breaking_news, total_contacts = db.query(
+                func.count(DBArticle.id),
+                func.count(DBArticle.id).filter(DBArticle.is_published == True),
+                func.count(DBArticle.id).filter(DBArticle.is_breaking == True),
+                db.query(func.count(DBContact.id)).scalar_subquery(),
+            ).one()
             
             # Check if emergency mode is active (if user_id is "emergency")
             emergency_mode = hasattr(current_user, 'id') and str(current_user.id) == "emergency"
@@ -2641,7 +2769,7 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
         }
 
 @api_router.get("/dashboard/articles", response_model=List[Article])
-async def get_dashboard_articles(current_user: User = Depends(get_current_user)):
+async def get_dashboard_articles(limit: int = 500, current_user: User = Depends(get_current_user)):
     """Get articles for dashboard with emergency fallback"""
     try:
         # Try database first
@@ -2649,37 +2777,12 @@ async def get_dashboard_articles(current_user: User = Depends(get_current_user))
         db = SessionLocal()
         try:
             if current_user.role == UserRole.ADMIN:
-                db_articles = db.query(DBArticle).order_by(DBArticle.created_at.desc()).all()
+                db_articles = db.query(DBArticle).order_by(DBArticle.created_at.desc()).limit(limit).all()
             else:
-                db_articles = db.query(DBArticle).filter(DBArticle.author_id == str(current_user.id)).order_by(DBArticle.created_at.desc()).all()
+                db_articles = db.query(DBArticle).filter(DBArticle.author_id == str(current_user.id)).order_by(DBArticle.created_at.desc()).limit(limit).all()
             
             # Convert to Pydantic models
-            articles = []
-            for db_article in db_articles:
-                article = Article(
-                    id=db_article.id,
-                    uuid=db_article.uuid,
-                    slug=db_article.slug,
-                    title=db_article.title,
-                    subheading=db_article.subheading,
-                    content=db_article.content,
-                    category=db_article.category,
-                    publisher_name=db_article.publisher_name,
-                    author_name=db_article.author_name,
-                    author_id=db_article.author_id,
-                    featured_image=db_article.featured_image,
-                    image_caption=db_article.image_caption,
-                    video_url=db_article.video_url,
-                    tags=json.loads(db_article.tags) if db_article.tags else [],
-                    category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
-                    is_breaking=db_article.is_breaking,
-                    is_published=db_article.is_published,
-                    pinned_at=db_article.pinned_at,
-                    priority=db_article.priority,
-                    created_at=db_article.created_at,
-                    updated_at=db_article.updated_at
-                )
-                articles.append(article)
+            articles = [article_from_db(db_article) for db_article in db_articles]
             
             db.close()
             return articles
@@ -2738,7 +2841,6 @@ async def create_contact(request: Request, db: Session = Depends(get_db)):
         
         db.add(db_contact)
         db.commit()
-        db.refresh(db_contact)
         
         logger.info(f"✅ CONTACT: Saved to database with ID: {db_contact.id}")
         
@@ -2927,7 +3029,9 @@ async def debug_list_slugs(limit: int = 50, current_user: User = Depends(get_cur
         raise HTTPException(status_code=403, detail="Admin access required")
     
     try:
-        articles = db.query(DBArticle).order_by(DBArticle.created_at.desc()).limit(limit).all()
+        articles = db.query(DBArticle).options(
+            load_only(DBArticle.id, DBArticle.slug, DBArticle.title, DBArticle.created_at)
+        ).order_by(DBArticle.created_at.desc()).limit(limit).all()
         return [
             {
                 "id": article.id,
@@ -2964,7 +3068,7 @@ async def debug_resolve_slug(slug: str, current_user: User = Depends(get_current
             }
         
         # Find closest matches using Levenshtein distance
-        all_articles = db.query(DBArticle).all()
+        all_articles = db.query(DBArticle).options(load_only(DBArticle.slug, DBArticle.title)).all()
         closest_matches = []
         
         for article in all_articles:
@@ -3020,8 +3124,8 @@ async def debug_og_values(slug: str, current_user: User = Depends(get_current_us
                 featured_image=db_article.featured_image,
                 image_caption=db_article.image_caption,
                 video_url=db_article.video_url,
-                tags=json.loads(db_article.tags) if db_article.tags else [],
-                category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
+                tags=db_article.tags or [],
+                category_labels=db_article.category_labels or [],
                 is_breaking=db_article.is_breaking,
                 is_published=db_article.is_published,
                 pinned_at=db_article.pinned_at,
@@ -3203,8 +3307,8 @@ async def debug_crawler_meta(slug: str, db: Session = Depends(get_db)):
             featured_image=db_article.featured_image,
             image_caption=db_article.image_caption,
             video_url=db_article.video_url,
-            tags=json.loads(db_article.tags) if db_article.tags else [],
-            category_labels=json.loads(db_article.category_labels) if db_article.category_labels else [],
+            tags=db_article.tags or [],
+            category_labels=db_article.category_labels or [],
             is_breaking=db_article.is_breaking,
             is_published=db_article.is_published,
             pinned_at=db_article.pinned_at,
@@ -3321,7 +3425,7 @@ async def debug_auth(db: Session = Depends(get_db)):
         for user in db_users:
             users_info.append({
                 "username": user.username,
-                "role": user.role.value if user.role else "unknown"
+                "role": user.role or "unknown"
             })
         
         # Test database connection
@@ -3370,13 +3474,13 @@ async def debug_users(current_user: User = Depends(get_current_user), db: Sessio
             password_test = None
             if user.username in ["admin", "admin_backup"]:
                 test_password = "admin123" if user.username == "admin" else "admin_backup"
-                password_test = verify_password(test_password, user.password_hash)
+                password_test = await run_in_threadpool(verify_password, test_password, user.password_hash)
             
             user_info = {
                 "id": user.id,
                 "username": user.username,
                 "email": user.email,
-                "role": user.role.value,
+                "role": user.role,
                 "is_active": user.is_active,
                 "created_at": user.created_at.isoformat() if user.created_at else None,
                 "updated_at": user.updated_at.isoformat() if user.updated_at else None,
@@ -3405,7 +3509,10 @@ async def debug_users(current_user: User = Depends(get_current_user), db: Sessio
 async def debug_articles(db: Session = Depends(get_db)):
     """Debug: Get articles info"""
     total_articles = db.query(DBArticle).count()
-    recent_articles = db.query(DBArticle).order_by(DBArticle.created_at.desc()).limit(3).all()
+    recent_articles = db.query(DBArticle).options(
+        load_only(DBArticle.id, DBArticle.uuid, DBArticle.title, DBArticle.category,
+                  DBArticle.is_breaking, DBArticle.created_at)
+    ).order_by(DBArticle.created_at.desc()).limit(3).all()
     
     sample_article_ids = [article.uuid for article in recent_articles]
     
@@ -3436,14 +3543,15 @@ async def create_test_article(
         raise HTTPException(status_code=403, detail="Admin access required")
     
     try:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         
         # Create test article
         article_data = ArticleCreate(
             title=f"CGZ TEST {timestamp}",
             subheading=f"Test article created at {timestamp}",
             content=f"This is a test article created for debugging purposes on {timestamp}. It includes all standard fields and can be used to verify article creation functionality.",
-            category=ArticleCategory.NEWS,
+            category=ArticleCategory.NEWS.value,
             publisher_name="The Crewkerne Gazette",
             is_breaking=is_breaking,
             is_published=True,
@@ -3455,7 +3563,7 @@ async def create_test_article(
         
         # Generate unique UUID and slug
         article_uuid = str(uuid.uuid4())
-        article_slug = generate_slug(article_data.title, db)
+        article_slug = generate_slug(article_data.title)
         
         # Create database article
         db_article = DBArticle(
@@ -3464,26 +3572,24 @@ async def create_test_article(
             title=article_data.title,
             subheading=article_data.subheading,
             content=article_data.content,
-            category=article_data.category,
+            category=coerce_category(article_data.category).value,
             publisher_name=article_data.publisher_name,
             author_name="Debug System",
             author_id=str(current_user.id),
             featured_image=None,
             image_caption=None,
             video_url=None,
-            tags=json.dumps(article_data.tags),
-            category_labels=json.dumps(article_data.category_labels),
+            tags=article_data.tags,
+            category_labels=article_data.category_labels,
             is_breaking=article_data.is_breaking,
             is_published=article_data.is_published,
-            pinned_at=datetime.now(timezone.utc) if pin else None,
+            pinned_at=now if pin else None,
             priority=article_data.priority,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            created_at=now,
+            updated_at=now
         )
         
-        db.add(db_article)
-        db.commit()
-        db.refresh(db_article)
+        add_article_with_unique_slug(db, db_article)
         
         return {
             "ok": True,
@@ -3530,7 +3636,8 @@ async def get_last_errors():
 async def debug_database_info():
     """Check database connection and column information"""
     try:
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from database import engine
         import os
         
         DATABASE_URL = os.getenv('DATABASE_URL', 'Not set')
@@ -3545,8 +3652,7 @@ async def debug_database_info():
                     user, _ = user_part.split(':', 1)
                     display_url = display_url.replace(user_part, f"{user}:***")
         
-        engine = create_engine(DATABASE_URL)
-        
+        # Reuse the app's pooled engine (it carries the sslmode-adjusted URL)
         with engine.connect() as conn:
             # Get table info
             result = conn.execute(text("""
@@ -3584,10 +3690,11 @@ async def create_test_article_simple(current_user: User = Depends(get_current_us
         raise HTTPException(status_code=403, detail="Admin required")
     
     try:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         title = f"CGZ TEST {timestamp}"
         article_uuid = str(uuid.uuid4())
-        slug = generate_slug(title, db)
+        slug = generate_slug(title)
         
         db_article = DBArticle(
             uuid=article_uuid,
@@ -3595,29 +3702,27 @@ async def create_test_article_simple(current_user: User = Depends(get_current_us
             title=title,
             subheading="Smoke test (pinned & breaking)",
             content="Automated test content for production validation.",
-            category=ArticleCategory.NEWS,
+            category=ArticleCategory.NEWS.value,
             publisher_name="The Crewkerne Gazette",
             author_name=current_user.username,
             author_id=str(current_user.id),
-            tags=json.dumps(["test", "smoke"]),
-            category_labels=json.dumps(["News", "Special"]),
+            tags=["test", "smoke"],
+            category_labels=["News", "Special"],
             is_breaking=True,
             is_published=True,
             priority=10,
-            pinned_at=datetime.now(timezone.utc),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            pinned_at=now,
+            created_at=now,
+            updated_at=now
         )
         
-        db.add(db_article)
-        db.commit()
-        db.refresh(db_article)
+        add_article_with_unique_slug(db, db_article)
         
         return {
             "ok": True, 
-            "slug": slug,
+            "slug": db_article.slug,
             "title": title,
-            "url": f"/article/{slug}",
+            "url": f"/article/{db_article.slug}",
             "is_breaking": True,
             "pinned_at": db_article.pinned_at,
             "priority": db_article.priority
@@ -3666,7 +3771,7 @@ async def debug_seed_one(current_user: User = Depends(get_current_user), db: Ses
     try:
         now = datetime.now(timezone.utc)
         title = f"SEED {now.strftime('%Y%m%d_%H%M%S')}"
-        slug = generate_slug(title, db)
+        slug = generate_slug(title)
         
         db_article = DBArticle(
             uuid=str(uuid.uuid4()),
@@ -3674,7 +3779,7 @@ async def debug_seed_one(current_user: User = Depends(get_current_user), db: Ses
             title=title,
             subheading="seed",
             content="seed content",
-            category=ArticleCategory.NEWS,
+            category=ArticleCategory.NEWS.value,
             publisher_name="The Crewkerne Gazette",
             author_name=current_user.username,
             author_id=str(current_user.id),
@@ -3682,15 +3787,13 @@ async def debug_seed_one(current_user: User = Depends(get_current_user), db: Ses
             is_published=True,
             pinned_at=now,
             priority=10,
-            tags=json.dumps(["seed"]),
-            category_labels=json.dumps(["News", "Special"]),
+            tags=["seed"],
+            category_labels=["News", "Special"],
             created_at=now,
             updated_at=now,
         )
         
-        db.add(db_article)
-        db.commit()
-        db.refresh(db_article)
+        add_article_with_unique_slug(db, db_article)
         
         logging.info(f"DEBUG_SEED_ONE: Successfully created article id={db_article.id}, slug='{db_article.slug}'")
         
@@ -3737,8 +3840,8 @@ async def get_article_structured_data(article_slug: str, db: Session = Depends(g
             "@type": "WebPage",
             "@id": f"https://crewkernegazette.co.uk/article/{article_slug}"
         },
-        "articleSection": db_article.category.value,
-        "keywords": ", ".join(json.loads(db_article.tags)) if db_article.tags else db_article.category.value
+        "articleSection": db_article.category,
+        "keywords": ", ".join(db_article.tags) if db_article.tags else db_article.category
     }
 
 # SEO Routes
@@ -3746,7 +3849,10 @@ async def get_article_structured_data(article_slug: str, db: Session = Depends(g
 async def generate_sitemap(db: Session = Depends(get_db)):
     """Generate dynamic sitemap for SEO"""
     try:
-        published_articles = db.query(DBArticle).filter(DBArticle.is_published == True).order_by(DBArticle.updated_at.desc()).all()
+        # Only the URL and lastmod are rendered; skip loading article bodies
+        published_articles = db.query(DBArticle).options(
+            load_only(DBArticle.slug, DBArticle.updated_at)
+        ).filter(DBArticle.is_published == True).order_by(DBArticle.updated_at.desc()).all()
         
         # Start sitemap XML
         sitemap_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -3818,7 +3924,9 @@ async def generate_news_sitemap(db: Session = Depends(get_db)):
         from datetime import datetime, timedelta
         week_ago = datetime.now() - timedelta(days=7)
         
-        recent_articles = db.query(DBArticle).filter(
+        recent_articles = db.query(DBArticle).options(
+            load_only(DBArticle.slug, DBArticle.title, DBArticle.created_at)
+        ).filter(
             DBArticle.is_published == True,
             DBArticle.created_at >= week_ago
         ).order_by(DBArticle.created_at.desc()).limit(1000).all()
@@ -3885,11 +3993,22 @@ Crawl-delay: 1
 # Include router and middleware
 app.include_router(api_router)
 
+class HashedStaticFiles(StaticFiles):
+    """StaticFiles for the React build, whose asset filenames carry a content hash.
+
+    A changed file always gets a new name, so browsers and the CDN can keep
+    every response for a year without revalidating.
+    """
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 # Mount frontend static files FIRST for static assets
 # Mount static files (only if directory exists)
 static_dir = Path("../frontend/build/static")
 if static_dir.exists():
-    app.mount("/static", StaticFiles(directory="../frontend/build/static"), name="static")
+    app.mount("/static", HashedStaticFiles(directory="../frontend/build/static"), name="static")
 else:
     logger.warning("Static files directory not found, skipping mount")
 
@@ -3946,7 +4065,7 @@ async def startup_event():
     """Initialize database on startup"""
     global SEEDING_STATUS, LAST_ERROR
     try:
-        status, error = init_database()
+        status, error = await run_in_threadpool(init_database)
         SEEDING_STATUS = status or "success"
         LAST_ERROR = error
         logger.info(f"📊 Database seeding status: {SEEDING_STATUS}")
@@ -3957,6 +4076,10 @@ async def startup_event():
         LAST_ERROR = str(e)
         logger.error(f"❌ Startup database initialization failed: {e}")
     
+    warmed = await run_in_threadpool(warm_pool)
+    if warmed:
+        logger.info(f"🔌 Warmed {warmed} database connections")
+    
     print("✅ Crewkerne Gazette PostgreSQL API ready!")
 
 if __name__ == "__main__":
@@ -18,13 +18,12 @@ import base64
 import bleach
 from PIL import Image
 import io
-import json
 
 # Database imports
 from sqlalchemy.orm import Session
 from database import (
     get_db, init_database, DBArticle, DBContact, DBUser, DBSettings,
-    ArticleCategory, UserRole
+    ArticleCategory, UserRole, get_article_by_uuid
 )
 
 ROOT_DIR = Path(__file__).parent
@@ -230,7 +229,7 @@ async def serve_article_page(article_uuid: str, request: Request, db: Session =
     if is_crawler(user_agent):
         # Serve static HTML with meta tags for crawlers
         try:
-            db_article = db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
+            db_article = get_article_by_uuid(db, article_uuid)
             if not db_article:
                 raise HTTPException(status_code=404, detail="Article not found")
             
@@ -248,7 +247,7 @@ async def serve_article_page(article_uuid: str, request: Request, db: Session =
                 featured_image=db_article.featured_image,
                 image_caption=db_article.image_caption,
                 video_url=db_article.video_url,
-                tags=json.loads(db_article.tags) if db_article.tags else [],
+                tags=db_article.tags or [],
                 is_breaking=db_article.is_breaking,
                 is_published=db_article.is_published,
                 created_at=db_article.created_at,
@@ -389,10 +388,10 @@ async def login(user_data: LoginRequest, db: Session = Depends(get_db)):
         return {
             "access_token": create_jwt_token({
                 "username": db_user.username,
-                "role": db_user.role.value
+                "role": db_user.role
             }),
             "token_type": "bearer",
-            "role": db_user.role.value
+            "role": db_user.role
         }
     
     raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -442,7 +441,7 @@ async def get_articles(limit: int = 10, category: Optional[str] = None, db: Sess
             featured_image=db_article.featured_image,
             image_caption=db_article.image_caption,
             video_url=db_article.video_url,
-            tags=json.loads(db_article.tags) if db_article.tags else [],
+            tags=db_article.tags or [],
             is_breaking=db_article.is_breaking,
             is_published=db_article.is_published,
             created_at=db_article.created_at,
@@ -455,7 +454,7 @@ async def get_articles(limit: int = 10, category: Optional[str] = None, db: Sess
 @api_router.get("/articles/{article_uuid}", response_model=Article)
 async def get_article(article_uuid: str, db: Session = Depends(get_db)):
     """Get article by UUID"""
-    db_article = db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
+    db_article = get_article_by_uuid(db, article_uuid)
     if not db_article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -472,7 +471,7 @@ async def get_article(article_uuid: str, db: Session = Depends(get_db)):
         featured_image=db_article.featured_image,
         image_caption=db_article.image_caption,
         video_url=db_article.video_url,
-        tags=json.loads(db_article.tags) if db_article.tags else [],
+        tags=db_article.tags or [],
         is_breaking=db_article.is_breaking,
         is_published=db_article.is_published,
         created_at=db_article.created_at,
@@ -491,21 +490,20 @@ async def create_article(article_data: ArticleCreate, current_user: User = Depen
         title=article_data.title,
         subheading=article_data.subheading,
         content=article_data.content,
-        category=article_data.category,
+        category=article_data.category.value,
         publisher_name=article_data.publisher_name,
         author_name=current_user.username,
         author_id=str(current_user.id),
         featured_image=article_data.featured_image,
         image_caption=article_data.image_caption,
         video_url=article_data.video_url,
-        tags=json.dumps(article_data.tags),
+        tags=article_data.tags,
         is_breaking=article_data.is_breaking,
         is_published=article_data.is_published
     )
     
     db.add(db_article)
     db.commit()
-    db.refresh(db_article)
     
     return Article(
         id=db_article.id,
@@ -520,7 +518,7 @@ async def create_article(article_data: ArticleCreate, current_user: User = Depen
         featured_image=db_article.featured_image,
         image_caption=db_article.image_caption,
         video_url=db_article.video_url,
-        tags=json.loads(db_article.tags) if db_article.tags else [],
+        tags=db_article.tags or [],
         is_breaking=db_article.is_breaking,
         is_published=db_article.is_published,
         created_at=db_article.created_at,
@@ -530,7 +528,7 @@ async def create_article(article_data: ArticleCreate, current_user: User = Depen
 @api_router.put("/articles/{article_uuid}", response_model=Article)
 async def update_article(article_uuid: str, article_data: ArticleCreate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Update existing article"""
-    db_article = db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
+    db_article = get_article_by_uuid(db, article_uuid)
     if not db_article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -542,18 +540,17 @@ async def update_article(article_uuid: str, article_data: ArticleCreate, current
     db_article.title = article_data.title
     db_article.subheading = article_data.subheading
     db_article.content = article_data.content
-    db_article.category = article_data.category
+    db_article.category = article_data.category.value
     db_article.publisher_name = article_data.publisher_name
     db_article.featured_image = article_data.featured_image
     db_article.image_caption = article_data.image_caption
     db_article.video_url = article_data.video_url
-    db_article.tags = json.dumps(article_data.tags)
+    db_article.tags = article_data.tags
     db_article.is_breaking = article_data.is_breaking
     db_article.is_published = article_data.is_published
     db_article.updated_at = datetime.now(timezone.utc)
     
     db.commit()
-    db.refresh(db_article)
     
     return Article(
         id=db_article.id,
@@ -568,7 +565,7 @@ async def update_article(article_uuid: str, article_data: ArticleCreate, current
         featured_image=db_article.featured_image,
         image_caption=db_article.image_caption,
         video_url=db_article.video_url,
-        tags=json.loads(db_article.tags) if db_article.tags else [],
+        tags=db_article.tags or [],
         is_breaking=db_article.is_breaking,
         is_published=db_article.is_published,
         created_at=db_article.created_at,
@@ -578,7 +575,7 @@ async def update_article(article_uuid: str, article_data: ArticleCreate, current
 @api_router.delete("/articles/{article_uuid}")
 async def delete_article(article_uuid: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Delete article"""
-    db_article = db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
+    db_article = get_article_by_uuid(db, article_uuid)
     if not db_article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -616,7 +613,7 @@ async def get_dashboard_articles(current_user: User = Depends(get_current_user),
             featured_image=db_article.featured_image,
             image_caption=db_article.image_caption,
             video_url=db_article.video_url,
-            tags=json.loads(db_article.tags) if db_article.tags else [],
+            tags=db_article.tags or [],
             is_breaking=db_article.is_breaking,
             is_published=db_article.is_published,
             created_at=db_article.created_at,
@@ -638,7 +635,6 @@ async def create_contact(contact_data: ContactCreate, db: Session = Depends(get_
     
     db.add(db_contact)
     db.commit()
-    db.refresh(db_contact)
     
     return Contact(
         id=db_contact.id,
@@ -729,7 +725,7 @@ async def debug_articles(db: Session = Depends(get_db)):
 @api_router.get("/articles/{article_uuid}/structured-data")
 async def get_article_structured_data(article_uuid: str, db: Session = Depends(get_db)):
     """Generate structured data for an article"""
-    db_article = db.query(DBArticle).filter(DBArticle.uuid == article_uuid).first()
+    db_article = get_article_by_uuid(db, article_uuid)
     if not db_article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -757,8 +753,8 @@ async def get_article_structured_data(article_uuid: str, db: Session = Depends(g
             "@type": "WebPage",
             "@id": f"https://crewkernegazette.co.uk/article/{article_uuid}"
         },
-        "articleSection": db_article.category.value,
-        "keywords": ", ".join(json.loads(db_article.tags)) if db_article.tags else db_article.category.value
+        "articleSection": db_article.category,
+        "keywords": ", ".join(db_article.tags) if db_article.tags else db_article.category
     }
 
 # Include router and middleware
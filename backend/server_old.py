@@ -1,29 +1,41 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
 import logging
+import anyio
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr, validator
 from typing import List, Optional
 import uuid
 from datetime import datetime, timedelta, timezone
 import bcrypt
+import hmac
 import jwt
 from enum import Enum
 import base64
 import bleach
 from PIL import Image
 import io
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import islice
+
+try:
+    import nh3
+except ImportError:  # nh3 is optional; bleach stays as the fallback sanitizer
+    nh3 = None
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # Create the main app
-app = FastAPI(title="Crewkerne Gazette API", version="1.0.0")
+app = FastAPI(title="Crewkerne Gazette API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -31,30 +43,53 @@ api_router = APIRouter(prefix="/api")
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET', 'emergency-fallback-secret-key')
 JWT_ALGORITHM = 'HS256'
+# Uploaded images are returned inline as data URIs
+MAX_IMAGE_UPLOAD_BYTES = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Padded standard base64, as produced by upload_image
+_BASE64_PAYLOAD = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+# Worker threads available to the sync (non-async) route handlers
+THREADPOOL_SIZE = int(os.environ.get('THREADPOOL_SIZE', 100))
+# bcrypt work factor for password hashes; 12 matches bcrypt.gensalt()'s default
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
 
 security = HTTPBearer()
 
 # Emergency storage - replaces database
 emergency_articles = []
+# id -> the same dict held in emergency_articles, for O(1) lookups by id
+_articles_by_id = {}
+# Newest-first (-created timestamp, id) keys: every article, per category, and
+# breaking only, so listings walk a pre-sorted bucket instead of sorting
+_articles_by_recency = []
+_articles_by_category = {}
+_breaking_articles = []
+# Handlers that don't await run on worker threads, so mutations of the
+# article storage and walks over the listing buckets hold this lock
+_articles_lock = threading.RLock()
 emergency_contacts = []
 emergency_settings = {
     "maintenance_mode": False,
     "show_breaking_news_banner": True
 }
+# Seeded users carry their initial password instead of a hash; it is hashed
+# on first successful login so importing the module does no bcrypt work
 emergency_users = {
     "admin": {
         "id": "admin-id",
         "username": "admin", 
         "email": "admin@crewkernegazette.com",
         "role": "admin",
-        "password_hash": bcrypt.hashpw("admin123".encode(), bcrypt.gensalt()).decode()
+        "password_hash": None,
+        "initial_password": "admin123"
     },
     "Gazette": {
         "id": "gazette-id", 
         "username": "Gazette",
         "email": "gazette@crewkernegazette.com", 
         "role": "admin",
-        "password_hash": bcrypt.hashpw("80085".encode(), bcrypt.gensalt()).decode()
+        "password_hash": None,
+        "initial_password": "80085"
     }
 }
 
@@ -74,6 +109,33 @@ class ContactStatus(str, Enum):
     READ = "read"
     REPLIED = "replied"
 
+# Markup allowed in article text, built once instead of per validated field
+ARTICLE_ALLOWED_TAGS = frozenset({'p', 'br', 'strong', 'em', 'u', 'a'})
+ARTICLE_ALLOWED_ATTRIBUTES = {'a': frozenset({'href'})}
+ARTICLE_URL_SCHEMES = frozenset({'http', 'https', 'mailto'})  # bleach's default protocols
+
+# bleach fallback: one Cleaner per thread, reused across calls (bleach.clean
+# rebuilds its parser and filters every time, and Cleaners aren't thread-safe)
+_bleach_local = threading.local()
+
+def sanitize_article_html(value: str) -> str:
+    """Strip article markup down to the allow-list (nh3 when installed, else bleach)"""
+    if nh3 is not None:
+        # link_rel=None keeps links exactly as written, matching the bleach output
+        return nh3.clean(
+            value,
+            tags=ARTICLE_ALLOWED_TAGS,
+            attributes=ARTICLE_ALLOWED_ATTRIBUTES,
+            url_schemes=ARTICLE_URL_SCHEMES,
+            link_rel=None,
+        )
+    cleaner = getattr(_bleach_local, 'cleaner', None)
+    if cleaner is None:
+        cleaner = _bleach_local.cleaner = bleach.sanitizer.Cleaner(
+            tags=ARTICLE_ALLOWED_TAGS, attributes={'a': ['href']}
+        )
+    return cleaner.clean(value)
+
 # Models with validation
 class User(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -107,20 +169,21 @@ class Article(BaseModel):
     @validator('content', 'title', 'subheading')
     def sanitize_html(cls, v):
         if v:
-            return bleach.clean(v, tags=['p', 'br', 'strong', 'em', 'u', 'a'], attributes={'a': ['href']})
+            return sanitize_article_html(v)
         return v
     
     @validator('featured_image')
     def validate_image(cls, v):
         if v and v.startswith('data:image/'):
-            # Check base64 size limit (5MB)
-            try:
-                header, data = v.split(',', 1)
-                decoded_size = len(base64.b64decode(data))
-                if decoded_size > 5 * 1024 * 1024:  # 5MB limit
-                    raise ValueError("Image too large (max 5MB)")
-            except:
+            # Check base64 size limit (5MB) from the encoded length instead of
+            # decoding a copy of the image just to measure it
+            header, sep, data = v.partition(',')
+            if not sep or len(data) % 4 or not _BASE64_PAYLOAD.fullmatch(data):
                 raise ValueError("Invalid base64 image")
+            padding = 2 if data.endswith('==') else 1 if data.endswith('=') else 0
+            decoded_size = len(data) // 4 * 3 - padding
+            if decoded_size > MAX_IMAGE_UPLOAD_BYTES:
+                raise ValueError("Image too large (max 5MB)")
         return v
 
 class ArticleCreate(BaseModel):
@@ -159,6 +222,43 @@ class PasswordChangeRequest(BaseModel):
     new_password: str = Field(..., min_length=6)
 
 # Utility Functions
+def _article_buckets(article: dict) -> list:
+    """The sorted listing buckets an article belongs in"""
+    category = getattr(article['category'], 'value', article['category'])
+    buckets = [_articles_by_recency, _articles_by_category.setdefault(category, [])]
+    if article.get('is_breaking'):
+        buckets.append(_breaking_articles)
+    return buckets
+
+def _recency_key(article: dict) -> tuple:
+    return (-article['created_at'].timestamp(), article['id'])
+
+def index_article(article: dict) -> None:
+    """Insert an article's key into its listing buckets, keeping them sorted"""
+    key = _recency_key(article)
+    for bucket in _article_buckets(article):
+        insort(bucket, key)
+
+def unindex_article(article: dict) -> None:
+    """Remove an article's key from its listing buckets"""
+    key = _recency_key(article)
+    for bucket in _article_buckets(article):
+        del bucket[bisect_left(bucket, key)]
+
+def store_article(article: dict) -> None:
+    """Add an article to emergency storage and its indexes"""
+    with _articles_lock:
+        emergency_articles.append(article)
+        _articles_by_id[article['id']] = article
+        index_article(article)
+
+def remove_article(article: dict) -> None:
+    """Drop an article from emergency storage and its indexes"""
+    with _articles_lock:
+        unindex_article(article)
+        del _articles_by_id[article['id']]
+        emergency_articles.remove(article)
+
 def is_crawler(user_agent: str) -> bool:
     """Detect if the request is from a social media crawler or bot"""
     if not user_agent:
@@ -188,11 +288,24 @@ def is_crawler(user_agent: str) -> bool:
     return any(crawler in user_agent_lower for crawler in crawlers)
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
 
+def check_user_password(user: dict, password: str) -> bool:
+    """Verify a user's password, hashing a seeded initial password on first use"""
+    if user['password_hash'] is None:
+        initial_password = user.get('initial_password')
+        if initial_password is None or not hmac.compare_digest(
+            password.encode('utf-8'), initial_password.encode('utf-8')
+        ):
+            return False
+        user['password_hash'] = hash_password(initial_password)
+        user.pop('initial_password', None)
+        return True
+    return verify_password(password, user['password_hash'])
+
 def create_jwt_token(user_id: str, username: str, role: str) -> str:
     payload = {
         'user_id': user_id,
@@ -226,10 +339,10 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 
 # Routes
 @api_router.post("/auth/login")
-async def login(user_data: UserLogin):
+def login(user_data: UserLogin):
     if user_data.username in emergency_users:
         user = emergency_users[user_data.username]
-        if verify_password(user_data.password, user['password_hash']):
+        if check_user_password(user, user_data.password):
             token = create_jwt_token(user['id'], user['username'], user['role'])
             return {
                 "access_token": token,
@@ -245,7 +358,7 @@ async def submit_contact(contact_data: ContactCreate):
     return contact_obj
 
 @api_router.post("/articles", response_model=Article)
-async def create_article(article_data: ArticleCreate, current_user: User = Depends(get_current_user)):
+def create_article(article_data: ArticleCreate, current_user: User = Depends(get_current_user)):
     print(f"📰 Creating article: {article_data.title}")
     if article_data.featured_image:
         print(f"🖼️  Article has image - Length: {len(article_data.featured_image)} chars")
@@ -255,40 +368,43 @@ async def create_article(article_data: ArticleCreate, current_user: User = Depen
     article_dict['author_name'] = current_user.username
     article_dict['updated_at'] = datetime.now(timezone.utc)
     article_obj = Article(**article_dict)
-    emergency_articles.append(article_obj.dict())
+    store_article(article_obj.dict())
     
     print(f"✅ Article stored - Total articles: {len(emergency_articles)}")
     return article_obj
 
-@api_router.get("/articles", response_model=List[Article])
-async def get_articles(category: Optional[str] = None, is_breaking: Optional[bool] = None, limit: int = 20):
-    articles = emergency_articles.copy()
-    if category:
-        articles = [a for a in articles if a.get("category") == category]
-    if is_breaking is not None:
-        articles = [a for a in articles if a.get("is_breaking") == is_breaking]
-    
-    # Improved sorting with fallback
-    articles = sorted(articles, key=lambda x: x.get("created_at", datetime.min.isoformat()), reverse=True)[:limit]
-    return [Article(**article) for article in articles]
+@api_router.get("/articles")
+def get_articles(category: Optional[str] = None, is_breaking: Optional[bool] = None, limit: int = 20):
+    # Start from the narrowest pre-sorted bucket; only the other filter is
+    # checked per article, and the walk stops once `limit` have matched
+    with _articles_lock:
+        if category:
+            bucket = _articles_by_category.get(category, [])
+        elif is_breaking:
+            bucket = _breaking_articles
+        else:
+            bucket = _articles_by_recency
+        
+        candidates = (_articles_by_id[article_id] for _, article_id in bucket)
+        if is_breaking is not None:
+            candidates = (a for a in candidates if a.get("is_breaking") == is_breaking)
+        articles = list(islice(candidates, max(limit, 0)))
+    # Stored dicts were validated (and sanitized) on the way in, so hand them
+    # straight to orjson rather than rebuilding and re-checking Article models
+    return ORJSONResponse(content=articles)
 
 @api_router.get("/articles/{article_id}", response_model=Article)
-async def get_article(article_id: str):
+def get_article(article_id: str):
     """Get individual article by ID with structured data"""
-    for article in emergency_articles:
-        if article.get("id") == article_id:
-            return Article(**article)
-    raise HTTPException(status_code=404, detail="Article not found")
+    article = _articles_by_id.get(article_id)
+    if article is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return Article.model_construct(**article)
 
 @api_router.get("/articles/{article_id}/related")
-async def get_related_articles(article_id: str):
+def get_related_articles(article_id: str):
     """Get related articles"""
-    current_article = None
-    for article in emergency_articles:
-        if article.get("id") == article_id:
-            current_article = article
-            break
-    
+    current_article = _articles_by_id.get(article_id)
     if not current_article:
         return []
     
@@ -298,19 +414,20 @@ async def get_related_articles(article_id: str):
         if (article.get("id") != article_id and 
             article.get("category") == current_article.get("category") and
             len(related) < 3):
-            related.append(Article(**article))
+            related.append(Article.model_construct(**article))
     
     return related
 
 @api_router.get("/articles/{article_id}/meta-html")
-async def get_article_meta_html(article_id: str):
+def get_article_meta_html(article_id: str):
     """Generate static HTML with meta tags for social sharing crawlers"""
-    for article in emergency_articles:
-        if article.get("id") == article_id:
-            article_obj = Article(**article)
-            
-            # Generate meta tags HTML
-            meta_html = f"""<!DOCTYPE html>
+    article = _articles_by_id.get(article_id)
+    if article is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    article_obj = Article.model_construct(**article)
+    
+    # Generate meta tags HTML
+    meta_html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -384,97 +501,107 @@ async def get_article_meta_html(article_id: str):
     <p>Redirecting to full article...</p>
 </body>
 </html>"""
-            
-            return HTMLResponse(content=meta_html)
     
-    raise HTTPException(status_code=404, detail="Article not found")
+    return HTMLResponse(content=meta_html)
 
 @api_router.get("/articles/{article_id}/structured-data")
-async def get_article_structured_data(article_id: str):
+def get_article_structured_data(article_id: str):
     """Generate structured data for an article"""
-    for article in emergency_articles:
-        if article.get("id") == article_id:
-            article_obj = Article(**article)
-            return {
-                "@context": "https://schema.org",
-                "@type": "NewsArticle",
-                "headline": article_obj.title,
-                "description": article_obj.subheading or article_obj.content[:160],
-                "image": article_obj.featured_image or "https://crewkernegazette.co.uk/logo.png",
-                "datePublished": article_obj.created_at.isoformat(),
-                "dateModified": article_obj.updated_at.isoformat(),
-                "author": {
-                    "@type": "Person",
-                    "name": article_obj.author_name or article_obj.publisher_name
-                },
-                "publisher": {
-                    "@type": "Organization",
-                    "name": "The Crewkerne Gazette",
-                    "logo": {
-                        "@type": "ImageObject",
-                        "url": "https://crewkernegazette.co.uk/logo.png"
-                    }
-                },
-                "mainEntityOfPage": {
-                    "@type": "WebPage",
-                    "@id": f"https://crewkernegazette.co.uk/article/{article_id}"
-                },
-                "articleSection": article_obj.category,
-                "keywords": ", ".join(article_obj.tags) if article_obj.tags else article_obj.category
+    article = _articles_by_id.get(article_id)
+    if article is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    article_obj = Article.model_construct(**article)
+    return {
+        "@context": "https://schema.org",
+        "@type": "NewsArticle",
+        "headline": article_obj.title,
+        "description": article_obj.subheading or article_obj.content[:160],
+        "image": article_obj.featured_image or "https://crewkernegazette.co.uk/logo.png",
+        "datePublished": article_obj.created_at.isoformat(),
+        "dateModified": article_obj.updated_at.isoformat(),
+        "author": {
+            "@type": "Person",
+            "name": article_obj.author_name or article_obj.publisher_name
+        },
+        "publisher": {
+            "@type": "Organization",
+            "name": "The Crewkerne Gazette",
+            "logo": {
+                "@type": "ImageObject",
+                "url": "https://crewkernegazette.co.uk/logo.png"
             }
-    raise HTTPException(status_code=404, detail="Article not found")
+        },
+        "mainEntityOfPage": {
+            "@type": "WebPage",
+            "@id": f"https://crewkernegazette.co.uk/article/{article_id}"
+        },
+        "articleSection": article_obj.category,
+        "keywords": ", ".join(article_obj.tags) if article_obj.tags else article_obj.category
+    }
 
 @api_router.get("/dashboard/stats")
-async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
+def get_dashboard_stats(current_user: User = Depends(get_current_user)):
     """Emergency dashboard stats"""
-    query_articles = emergency_articles.copy()
-    if current_user.role != UserRole.ADMIN:
-        query_articles = [a for a in query_articles if a.get("author_id") == current_user.id]
+    # Tally everything in one pass over the articles instead of one
+    # comprehension per statistic
+    is_admin = current_user.role == UserRole.ADMIN
+    categories = Counter()
+    total_articles = published_articles = breaking_news = 0
+    for article in emergency_articles:
+        if not is_admin and article.get("author_id") != current_user.id:
+            continue
+        total_articles += 1
+        category = article.get("category")
+        categories[getattr(category, "value", category)] += 1
+        if article.get("is_published", True):
+            published_articles += 1
+        if article.get("is_breaking", False):
+            breaking_news += 1
     
     return {
-        "total_articles": len(query_articles),
-        "published_articles": len([a for a in query_articles if a.get("is_published", True)]),
-        "breaking_news": len([a for a in query_articles if a.get("is_breaking", False)]),
+        "total_articles": total_articles,
+        "published_articles": published_articles,
+        "breaking_news": breaking_news,
         "total_contacts": len(emergency_contacts),
-        "new_contacts": len([c for c in emergency_contacts if c.get("status") == "new"]),
+        "new_contacts": sum(1 for c in emergency_contacts if c.get("status") == "new"),
         "categories": {
-            "news": len([a for a in query_articles if a.get("category") == "news"]),
-            "music": len([a for a in query_articles if a.get("category") == "music"]),
-            "documentaries": len([a for a in query_articles if a.get("category") == "documentaries"]),
-            "comedy": len([a for a in query_articles if a.get("category") == "comedy"])
+            "news": categories["news"],
+            "music": categories["music"],
+            "documentaries": categories["documentaries"],
+            "comedy": categories["comedy"]
         },
         "emergency_mode": True
     }
 
-@api_router.get("/dashboard/articles", response_model=List[Article])
-async def get_dashboard_articles(current_user: User = Depends(get_current_user)):
-    articles = emergency_articles.copy()
-    if current_user.role != UserRole.ADMIN:
-        articles = [a for a in articles if a.get("author_id") == current_user.id]
-    articles = sorted(articles, key=lambda x: x.get("created_at", datetime.min.isoformat()), reverse=True)
-    return [Article(**article) for article in articles]
+@api_router.get("/dashboard/articles")
+def get_dashboard_articles(current_user: User = Depends(get_current_user)):
+    # The recency bucket is already newest first, keyed on float timestamps;
+    # filter by author in the same pass that resolves the ids
+    is_admin = current_user.role == UserRole.ADMIN
+    articles = []
+    with _articles_lock:
+        for _, article_id in _articles_by_recency:
+            article = _articles_by_id[article_id]
+            if is_admin or article.get("author_id") == current_user.id:
+                articles.append(article)
+    return ORJSONResponse(content=articles)
 
 @api_router.put("/articles/{article_id}", response_model=Article)
-async def update_article(article_id: str, article_data: ArticleCreate, current_user: User = Depends(get_current_user)):
+def update_article(article_id: str, article_data: ArticleCreate, current_user: User = Depends(get_current_user)):
     """Update an existing article"""
     # Find the article to update
-    article_index = None
-    for i, article in enumerate(emergency_articles):
-        if article.get("id") == article_id:
-            article_index = i
-            break
-    
-    if article_index is None:
+    existing_article = _articles_by_id.get(article_id)
+    if existing_article is None:
         raise HTTPException(status_code=404, detail="Article not found")
     
     # Check permissions
-    existing_article = emergency_articles[article_index]
     if current_user.role != UserRole.ADMIN and existing_article.get("author_id") != current_user.id:
         raise HTTPException(status_code=403, detail="You can only edit your own articles")
     
-    # Update the article
-    updated_article = {
-        **existing_article,  # Keep existing fields
+    # Validate the merged article once so stored dicts stay sanitized and
+    # reads can skip validation
+    updated_article = Article(**{
+        **existing_article,
         "title": article_data.title,
         "subheading": article_data.subheading,
         "content": article_data.content,
@@ -487,33 +614,35 @@ async def update_article(article_id: str, article_data: ArticleCreate, current_u
         "is_published": article_data.is_published,
         "tags": article_data.tags,
         "updated_at": datetime.now(timezone.utc)
-    }
+    })
     
-    # Replace the article in emergency storage
-    emergency_articles[article_index] = updated_article
+    # Update the article in place (the list and the id index share this dict);
+    # category and breaking may change, so re-file it in the listing buckets
+    with _articles_lock:
+        if _articles_by_id.get(article_id) is not existing_article:
+            # Deleted while this update was being validated
+            raise HTTPException(status_code=404, detail="Article not found")
+        unindex_article(existing_article)
+        existing_article.update(updated_article.dict())
+        index_article(existing_article)
     
-    return Article(**updated_article)
+    return updated_article
 
 @api_router.delete("/articles/{article_id}")
-async def delete_article(article_id: str, current_user: User = Depends(get_current_user)):
+def delete_article(article_id: str, current_user: User = Depends(get_current_user)):
     """Delete an article"""
-    # Find the article to delete
-    article_index = None
-    for i, article in enumerate(emergency_articles):
-        if article.get("id") == article_id:
-            article_index = i
-            break
-    
-    if article_index is None:
-        raise HTTPException(status_code=404, detail="Article not found")
-    
-    # Check permissions
-    existing_article = emergency_articles[article_index]
-    if current_user.role != UserRole.ADMIN and existing_article.get("author_id") != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only delete your own articles")
-    
-    # Remove the article from emergency storage
-    deleted_article = emergency_articles.pop(article_index)
+    with _articles_lock:
+        # Find the article to delete
+        existing_article = _articles_by_id.get(article_id)
+        if existing_article is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        
+        # Check permissions
+        if current_user.role != UserRole.ADMIN and existing_article.get("author_id") != current_user.id:
+            raise HTTPException(status_code=403, detail="You can only delete your own articles")
+        
+        # Remove the article from emergency storage
+        remove_article(existing_article)
     
     return {"message": "Article deleted successfully", "deleted_article_id": article_id}
 
@@ -550,7 +679,7 @@ async def toggle_breaking_news_banner(banner_data: BreakingNewsBanner, current_u
     return {"message": f"Breaking news banner {status_text} successfully"}
 
 @api_router.post("/auth/change-password")
-async def change_password(password_data: PasswordChangeRequest, current_user: User = Depends(get_current_user)):
+def change_password(password_data: PasswordChangeRequest, current_user: User = Depends(get_current_user)):
     """Change user password"""
     if current_user.username not in emergency_users:
         raise HTTPException(status_code=404, detail="User not found")
@@ -558,7 +687,7 @@ async def change_password(password_data: PasswordChangeRequest, current_user: Us
     user = emergency_users[current_user.username]
     
     # Verify current password
-    if not verify_password(password_data.current_password, user['password_hash']):
+    if not check_user_password(user, password_data.current_password):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
     
     # Update password
@@ -569,29 +698,32 @@ async def change_password(password_data: PasswordChangeRequest, current_user: Us
 
 @api_router.post("/upload-image")
 async def upload_image(file: UploadFile = File(...), current_user: User = Depends(get_current_user)):
-    print(f"🔍 Upload started - File: {file.filename}, Type: {file.content_type}, Size: {file.size}")
-    
     if not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
     
-    # Size limit check (5MB)
-    if file.size > 5 * 1024 * 1024:
+    # Size limit check (5MB); the streamed read below enforces it too when
+    # the client didn't declare a size
+    if file.size is not None and file.size > MAX_IMAGE_UPLOAD_BYTES:
         raise HTTPException(status_code=400, detail="Image too large (max 5MB)")
     
-    # Read file content
-    file_content = await file.read()
-    print(f"📁 File content read - Size: {len(file_content)} bytes")
-    
-    # Convert to base64
-    base64_string = base64.b64encode(file_content).decode('utf-8')
-    print(f"📝 Base64 created - Length: {len(base64_string)} characters")
-    
-    # Create data URI for immediate use
-    mime_type = file.content_type
-    data_uri = f"data:{mime_type};base64,{base64_string}"
-    print(f"🌐 Data URI created - Total length: {len(data_uri)} characters")
-    
-    return {"url": data_uri, "debug": {"size": len(file_content), "base64_length": len(base64_string)}}
+    # Build the data URI in one buffer, base64-encoding the upload a chunk at
+    # a time; leftover bytes carry over so each encoded piece is a multiple
+    # of 3 bytes and needs no padding mid-stream
+    data_uri = bytearray(f"data:{file.content_type};base64,".encode('ascii'))
+    prefix_length = len(data_uri)
+    total_size = 0
+    pending = b''
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total_size += len(chunk)
+        if total_size > MAX_IMAGE_UPLOAD_BYTES:
+            raise HTTPException(status_code=400, detail="Image too large (max 5MB)")
+        pending += chunk
+        usable = len(pending) - len(pending) % 3
+        data_uri += base64.b64encode(pending[:usable])
+        pending = pending[usable:]
+    data_uri += base64.b64encode(pending)
+    
+    return {"url": data_uri.decode('ascii'), "debug": {"size": total_size, "base64_length": len(data_uri) - prefix_length}}
 
 # Debug endpoints
 @api_router.get("/debug/articles")
@@ -610,28 +742,27 @@ async def debug_settings():
         "current_settings": emergency_settings
     }
 
-# Add some sample articles
-emergency_articles.extend([
-    {
-        "id": str(uuid.uuid4()),
-        "title": "Welcome to The Crewkerne Gazette",
-        "subheading": "Your trusted source for local news and investigations",
-        "content": "The Crewkerne Gazette is now running with full functionality. All features work seamlessly including article creation, image uploads, social sharing, and breaking news management.",
-        "category": "news",
-        "author_id": "admin-id", 
-        "author_name": "admin",
-        "publisher_name": "The Crewkerne Gazette",
-        "is_breaking": True,
-        "is_published": True,
-        "tags": ["welcome", "announcement", "local"],
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc)
-    }
-])
+# Add some sample articles; stored as Article dicts, like create_article does,
+# so every field is present when the list endpoints return them unvalidated
+for sample_article in [
+    Article(
+        title="Welcome to The Crewkerne Gazette",
+        subheading="Your trusted source for local news and investigations",
+        content="The Crewkerne Gazette is now running with full functionality. All features work seamlessly including article creation, image uploads, social sharing, and breaking news management.",
+        category=ArticleCategory.NEWS,
+        author_id="admin-id",
+        author_name="admin",
+        publisher_name="The Crewkerne Gazette",
+        is_breaking=True,
+        is_published=True,
+        tags=["welcome", "announcement", "local"]
+    )
+]:
+    store_article(sample_article.dict())
 
 # Article page route for social media crawlers
 @app.get("/article/{article_id}")
-async def serve_article_page(article_id: str, request: Request):
+def serve_article_page(article_id: str, request: Request):
     """
     Serve article page with proper meta tags for crawlers,
     or serve React app for regular users
@@ -641,41 +772,43 @@ async def serve_article_page(article_id: str, request: Request):
     if is_crawler(user_agent):
         # Serve static HTML with meta tags for crawlers
         try:
-            for article in emergency_articles:
-                if article.get("id") == article_id:
-                    article_obj = Article(**article)
-                    
-                    # Sanitize text content for HTML
-                    title_safe = article_obj.title.replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
-                    description_safe = (article_obj.subheading or article_obj.content[:160]).replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
-                    
-                    # Calculate image dimensions for better social sharing
-                    image_width_tag = ''
-                    image_height_tag = ''
-                    image_url = article_obj.featured_image or 'https://crewkernegazette.co.uk/logo.png'
-                    
-                    if article_obj.featured_image and article_obj.featured_image.startswith('data:image/'):
-                        try:
-                            # Extract base64 data
-                            header, data = article_obj.featured_image.split(',', 1)
-                            image_data = base64.b64decode(data)
-                            # Get dimensions with PIL
-                            img = Image.open(io.BytesIO(image_data))
-                            image_width_tag = f'    <meta property="og:image:width" content="{img.width}">'
-                            image_height_tag = f'    <meta property="og:image:height" content="{img.height}">'
-                            print(f"📏 Image dimensions calculated: {img.width}x{img.height}")
-                        except Exception as e:
-                            print(f"⚠️ Failed to get image dimensions: {e}")
-                            # Fallback to standard social media dimensions
-                            image_width_tag = '    <meta property="og:image:width" content="1200">'
-                            image_height_tag = '    <meta property="og:image:height" content="630">'
-                    else:
-                        # Default dimensions for external images
-                        image_width_tag = '    <meta property="og:image:width" content="1200">'
-                        image_height_tag = '    <meta property="og:image:height" content="630">'
-                    
-                    # Generate SEO-friendly meta HTML for crawlers
-                    meta_html = f"""<!DOCTYPE html>
+            article = _articles_by_id.get(article_id)
+            if article is None:
+                # Article not found - return 404
+                raise HTTPException(status_code=404, detail="Article not found")
+            article_obj = Article.model_construct(**article)
+            
+            # Sanitize text content for HTML
+            title_safe = article_obj.title.replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
+            description_safe = (article_obj.subheading or article_obj.content[:160]).replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
+            
+            # Calculate image dimensions for better social sharing
+            image_width_tag = ''
+            image_height_tag = ''
+            image_url = article_obj.featured_image or 'https://crewkernegazette.co.uk/logo.png'
+            
+            if article_obj.featured_image and article_obj.featured_image.startswith('data:image/'):
+                try:
+                    # Extract base64 data
+                    header, data = article_obj.featured_image.split(',', 1)
+                    image_data = base64.b64decode(data)
+                    # Get dimensions with PIL
+                    img = Image.open(io.BytesIO(image_data))
+                    image_width_tag = f'    <meta property="og:image:width" content="{img.width}">'
+                    image_height_tag = f'    <meta property="og:image:height" content="{img.height}">'
+                    print(f"📏 Image dimensions calculated: {img.width}x{img.height}")
+                except Exception as e:
+                    print(f"⚠️ Failed to get image dimensions: {e}")
+                    # Fallback to standard social media dimensions
+                    image_width_tag = '    <meta property="og:image:width" content="1200">'
+                    image_height_tag = '    <meta property="og:image:height" content="630">'
+            else:
+                # Default dimensions for external images
+                image_width_tag = '    <meta property="og:image:width" content="1200">'
+                image_height_tag = '    <meta property="og:image:height" content="630">'
+            
+            # Generate SEO-friendly meta HTML for crawlers
+            meta_html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -717,11 +850,8 @@ async def serve_article_page(article_id: str, request: Request):
     <p><em>Read the full article at: <a href="https://crewkernegazette.co.uk/article/{article_id}">The Crewkerne Gazette</a></em></p>
 </body>
 </html>"""
-                    
-                    return HTMLResponse(content=meta_html)
             
-            # Article not found - return 404
-            raise HTTPException(status_code=404, detail="Article not found")
+            return HTMLResponse(content=meta_html)
             
         except Exception as e:
             # Error generating meta HTML - return generic 404
@@ -748,6 +878,11 @@ async def serve_article_page(article_id: str, request: Request):
                 headers={"Location": f"/"}
             )
 
+@app.on_event("startup")
+async def configure_threadpool():
+    """Give sync handlers more worker threads than AnyIO's default of 40"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
 # Include router and middleware
 app.include_router(api_router)
 